@@ -6,6 +6,7 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import TypedDict, Union
 
+import numpy as np
 import pandas as pd
 
 from assume.common.forecasts import Forecaster
@@ -181,9 +182,14 @@ class BaseUnit:
         if start not in self.index:
             start = self.index[0]
         product_type_mc = product_type + "_marginal_costs"
-        for t in self.outputs[product_type_mc][start:end].index:
-            mc = self.calculate_marginal_cost(t, self.outputs[product_type].loc[t])
-            self.outputs[product_type_mc][t] = abs(mc * self.outputs[product_type][t])
+        # compute the costs for the whole range and write them back in one assignment
+        dispatch = self.outputs[product_type].loc[start:end]
+        marginal_costs = self.calculate_marginal_cost_vector(
+            dispatch.index, dispatch.tolist()
+        )
+        self.outputs[product_type_mc].loc[start:end] = np.abs(
+            np.asarray(marginal_costs, dtype=float) * dispatch.to_numpy()
+        )
 
     def execute_current_dispatch(
         self,
@@ -293,6 +299,26 @@ class BaseUnit:
         """
         pass
 
+    def calculate_marginal_cost_vector(
+        self, starts: list[pd.Timestamp], powers: list[float]
+    ) -> list[float]:
+        """
+        Calculates the marginal costs for multiple start times at once.
+
+        Units with precomputed marginal costs can override this to look them up in one go.
+
+        Args:
+            starts (list[pandas.Timestamp]): The start times of the dispatch.
+            powers (list[float]): The power output of the unit at each start time.
+
+        Returns:
+            list[float]: The marginal cost for each start time and power.
+        """
+        return [
+            self.calculate_marginal_cost(start, power)
+            for start, power in zip(starts, powers)
+        ]
+
 
 class SupportsMinMax(BaseUnit):
     """
@@ -754,6 +780,34 @@ class LearningStrategy(BaseStrategy):
         self.obs_dim = kwargs.get("observation_dimension", 50)
         self.act_dim = kwargs.get("action_dimension", 2)
 
+        # pinned staging buffer to copy the action noise to the GPU asynchronously
+        self._noise_host = None
+
+    def get_action_noise(self):
+        """
+        Gets the exploration noise of the actions on the device of the actor.
+
+        Returns:
+            Noise (torch.Tensor): Noise which is added to the actions.
+
+        Note:
+            The noise is stored in the unit outputs, so a new tensor is returned for every call.
+            Only the buffer used for the transfer to the GPU is reused.
+        """
+        import torch as th
+
+        noise = th.from_numpy(self.action_noise.noise())
+        if self.device.type != "cuda":
+            return noise.to(self.float_type)
+
+        if self._noise_host is None:
+            self._noise_host = th.empty(
+                self.act_dim, dtype=self.float_type
+            ).pin_memory()
+        # the previous transfer is completed, as the actions are read on the CPU after each call
+        self._noise_host.copy_(noise)
+        return self._noise_host.to(self.device, non_blocking=True)
+
 
 class LearningConfig(TypedDict):
     """
@@ -32,9 +32,9 @@ class Order(TypedDict):
         bid_id (str): the id of the bid
         start_time (datetime.datetime): the start time of the order
         end_time (datetime.datetime): the end time of the order
-        volume (Number | dict[datetime, Number]): the volume of the order (positive if generation)
+        volume (Number | dict[datetime, Number]): the volume of the order (positive if generation), an int number of ticks if the market has a volume_tick
         accepted_volume (Number | dict[datetime, Number]): the accepted volume of the order
-        price (Number): the price of the order
+        price (Number): the price of the order, an int number of ticks if the market has a price_tick
         accepted_price (Number | dict[datetime, Number]): the accepted price of the order
         agent_id (str): the id of the agent
         only_hours (OnlyHours | None): tuple of hours from which this order is available, on multi day products
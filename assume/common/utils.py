@@ -7,7 +7,8 @@ import inspect
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from functools import wraps
+from fractions import Fraction
+from functools import lru_cache, wraps
 from itertools import groupby
 from operator import itemgetter
 
@@ -69,17 +70,13 @@ def get_available_products(market_products: list[MarketProduct], startdate: date
     options = []
     for product in market_products:
         start = startdate + product.first_delivery
+        # the end of a period is the start of the next one
         if isinstance(product.duration, rr.rrule):
-            starts = list(product.duration.xafter(start, product.count + 1), inc=True)
-            for i in range(product.count):
-                period_start = starts[i]
-                period_end = starts[i + 1]
-                options.append((period_start, period_end, product.only_hours))
+            starts = list(product.duration.xafter(start, product.count + 1, inc=True))
         else:
-            for i in range(product.count):
-                period_start = start + product.duration * i
-                period_end = start + product.duration * (i + 1)
-                options.append((period_start, period_end, product.only_hours))
+            starts = [start + product.duration * i for i in range(product.count + 1)]
+        for i in range(product.count):
+            options.append((starts[i], starts[i + 1], product.only_hours))
     return options
 
 
@@ -362,39 +359,89 @@ def separate_orders(orderbook: Orderbook):
     """
 
     # separate orders with several hours into single hour orders
-    delete_orders = []
+    single_hour_orders = []
+    separated_orders = []
     for order in orderbook:
-        if any([isinstance(value, dict) for value in order.values()]):
-            start_hour = order["start_time"]
-            end_hour = order["end_time"]
-            order_len = max(
-                len(value) for value in order.values() if isinstance(value, dict)
-            )
-            duration = (end_hour - start_hour) / order_len
+        dict_keys = [key for key, value in order.items() if isinstance(value, dict)]
+        if not dict_keys:
+            single_hour_orders.append(order)
+            continue
 
-            for start in pd.date_range(start_hour, end_hour - duration, freq=duration):
-                single_order = order.copy()
-                for key in order.keys():
-                    if isinstance(order[key], dict):
-                        single_order.update({key: order[key][start]})
-                if single_order != order:
-                    single_order.update(
-                        {
-                            "start_time": start,
-                            "end_time": start + duration,
-                        }
-                    )
+        start_hour = order["start_time"]
+        end_hour = order["end_time"]
+        order_len = max(len(order[key]) for key in dict_keys)
+        duration = (end_hour - start_hour) / order_len
 
-                orderbook.append(single_order)
+        for start in pd.date_range(start_hour, end_hour - duration, freq=duration):
+            single_order = order.copy()
+            for key in dict_keys:
+                single_order[key] = order[key][start]
+            if single_order != order:
+                single_order["start_time"] = start
+                single_order["end_time"] = start + duration
 
-            delete_orders.append(order)
+            separated_orders.append(single_order)
 
-    for order in delete_orders:
-        orderbook.remove(order)
+    # separated orders are placed after the single hour orders
+    orderbook[:] = single_hour_orders + separated_orders
 
     return orderbook
 
 
+def get_first_invalid_order(
+    prices: np.ndarray,
+    volumes: np.ndarray,
+    max_price: float,
+    min_price: float,
+    max_volume: float | None = None,
+) -> int:
+    """
+    Get the index of the first order which violates the price or volume limits of a market.
+
+    Args:
+        prices (numpy.ndarray): The prices of the orders.
+        volumes (numpy.ndarray): The volumes of the orders.
+        max_price (float): The maximum bid price.
+        min_price (float): The minimum bid price.
+        max_volume (float | None): The maximum absolute bid volume, not checked if None.
+
+    Returns:
+        int: The index of the first invalid order or -1 if all orders are valid.
+    """
+    # written as negated bounds so that NaN prices and volumes are invalid
+    invalid = ~((prices <= max_price) & (prices >= min_price))
+    if max_volume:
+        invalid |= ~(np.abs(volumes) <= max_volume)
+
+    if not invalid.any():
+        return -1
+    return int(invalid.argmax())
+
+
+@lru_cache(maxsize=None)
+def get_available_solver(solvers: tuple[str, ...]) -> str:
+    """
+    Returns the name of the first available solver.
+
+    The result is cached, as checking the availability runs each solver on a test problem.
+
+    Args:
+        solvers (tuple[str, ...]): The names of the solvers in order of preference.
+
+    Returns:
+        str: The name of the solver.
+
+    Raises:
+        Exception: If none of the solvers are available.
+    """
+    from pyomo.opt import check_available_solvers
+
+    available_solvers = check_available_solvers(*solvers)
+    if len(available_solvers) < 1:
+        raise Exception(f"None of {solvers} are available")
+    return available_solvers[0]
+
+
 def get_products_index(orderbook: Orderbook) -> pd.DatetimeIndex:
     """
     Creates an index containing all start times of orders in orderbook and all inbetween.
@@ -430,6 +477,19 @@ def get_products_index(orderbook: Orderbook) -> pd.DatetimeIndex:
     return index_products
 
 
+def to_fraction(value: float) -> Fraction:
+    """
+    Converts a number to an exact fraction of its decimal representation.
+
+    Args:
+        value (float): The number to convert.
+
+    Returns:
+        fractions.Fraction: The fraction, e.g. 1/10 for 0.1.
+    """
+    return Fraction(str(value))
+
+
 def timestamp2datetime(timestamp: float):
     return datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None)
 
@@ -2,12 +2,11 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import asyncio
 import logging
-import math
-from datetime import datetime
-from itertools import groupby
-from operator import itemgetter
+from collections import defaultdict
 
+import numpy as np
 from mango import Role
 
 from assume.common.market_objects import (
@@ -25,8 +24,10 @@ from assume.common.market_objects import (
 from assume.common.utils import (
     datetime2timestamp,
     get_available_products,
+    get_first_invalid_order,
     separate_orders,
     timestamp2datetime,
+    to_fraction,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,7 @@ class MarketMechanism:
 
     Attributes:
         all_orders (Orderbook): The list of all orders.
+        orders_by_product (dict[tuple, Orderbook]): The orders of all_orders grouped by (start_time, end_time, only_hours).
         marketconfig (MarketConfig): The configuration of the market.
         open_auctions (set): The list of open auctions.
         results (list[dict]): The list of market metadata.
@@ -55,7 +57,51 @@ class MarketMechanism:
         self.marketconfig = marketconfig
         self.open_auctions = set()
         self.all_orders = []
+        self.orders_by_product = defaultdict(list)
         self.results = []
+        self._limits_key = None
+        self._limits = None
+
+    def get_bid_limits(self) -> tuple:
+        """
+        Returns the bid limits of the market config converted to tick units.
+
+        The limits are cached, so that validating an orderbook only needs integer comparisons.
+        They are calculated again if the market config was changed.
+
+        Returns:
+            tuple: The maximum price, minimum price, maximum volume and the additional fields.
+        """
+        config = self.marketconfig
+        key = (
+            config.price_tick,
+            config.maximum_bid_price,
+            config.minimum_bid_price,
+            config.volume_tick,
+            config.maximum_bid_volume,
+            tuple(config.additional_fields),
+        )
+        if key == self._limits_key:
+            return self._limits
+
+        max_price = config.maximum_bid_price
+        min_price = config.minimum_bid_price
+        max_volume = config.maximum_bid_volume
+        # unset limits stay None, validate_orderbook reports them if they are needed
+        if config.price_tick:
+            # max and min should be in units
+            # exact fractions avoid rounding errors of floats like 0.1
+            price_tick = to_fraction(config.price_tick)
+            if max_price is not None:
+                max_price = to_fraction(max_price) // price_tick
+            if min_price is not None:
+                min_price = -(-to_fraction(min_price) // price_tick)
+        if config.volume_tick and max_volume is not None:
+            max_volume = to_fraction(max_volume) // to_fraction(config.volume_tick)
+
+        self._limits_key = key
+        self._limits = (max_price, min_price, max_volume, key[-1])
+        return self._limits
 
     def validate_registration(
         self, content: RegistrationMessage, meta: MetaDict
@@ -76,7 +122,7 @@ class MarketMechanism:
         def requirement(unit: dict):
             return unit.get("unit_type") != "power_plant" or abs(unit["max_power"]) > 0
 
-        return all([requirement(info) for info in content["information"]])
+        return all(map(requirement, content["information"]))
 
     def validate_orderbook(self, orderbook: Orderbook, agent_tuple: tuple) -> None:
         """
@@ -89,48 +135,63 @@ class MarketMechanism:
             agent_tuple (tuple): The tuple of the agent.
 
         Raises:
-            AssertionError: If the orderbook is invalid.
+            ValueError: If the orderbook is invalid.
         """
-        max_price = self.marketconfig.maximum_bid_price
-        min_price = self.marketconfig.minimum_bid_price
-        max_volume = self.marketconfig.maximum_bid_volume
+        max_price, min_price, max_volume, additional_fields = self.get_bid_limits()
 
         if self.marketconfig.price_tick:
-            assert max_price is not None, "max_price unset"
-            assert min_price is not None, "min_price unset"
-            assert max_volume is not None, "max_volume unset"
-            # max and min should be in units
-            max_price = math.floor(max_price / self.marketconfig.price_tick)
-            min_price = math.ceil(min_price / self.marketconfig.price_tick)
-        if self.marketconfig.volume_tick:
-            assert max_volume is not None, "max_volume unset"
-            max_volume = math.floor(max_volume / self.marketconfig.volume_tick)
+            if max_price is None:
+                raise ValueError("max_price unset")
+            if min_price is None:
+                raise ValueError("min_price unset")
+            if max_volume is None:
+                raise ValueError("max_volume unset")
+        if self.marketconfig.volume_tick and max_volume is None:
+            raise ValueError("max_volume unset")
 
         for order in orderbook:
             order["agent_id"] = agent_tuple
             if not order.get("only_hours"):
                 order["only_hours"] = None
-            for field in self.marketconfig.additional_fields:
-                assert field in order.keys(), f"missing field: {field}"
+            for field in additional_fields:
+                if field not in order:
+                    raise ValueError(f"missing field: {field}")
 
         sep_orders = separate_orders(orderbook.copy())
-        for order in sep_orders:
-            assert order["price"] <= max_price, f"maximum_bid_price {order['price']}"
-            assert order["price"] >= min_price, f"minimum_bid_price {order['price']}"
-
-            # check that the product is part of an open auction
-            product = (order["start_time"], order["end_time"], order["only_hours"])
-            assert product in self.open_auctions, "no open auction"
+        if not sep_orders:
+            return
 
-            if max_volume:
-                assert (
-                    abs(order["volume"]) <= max_volume
-                ), f"max_volume {order['volume']}"
+        # check the bounds of all single hour orders at once
+        prices = [order["price"] for order in sep_orders]
+        volumes = [order["volume"] for order in sep_orders]
+        invalid_index = get_first_invalid_order(
+            np.array(prices), np.array(volumes), max_price, min_price, max_volume
+        )
+        if invalid_index >= 0:
+            invalid_order = sep_orders[invalid_index]
+            raise ValueError(
+                f"order {invalid_order.get('bid_id')} at {invalid_order['start_time']} exceeds the market limits - price {prices[invalid_index]}, volume {volumes[invalid_index]}"
+            )
 
-            if self.marketconfig.price_tick:
-                assert isinstance(order["price"], int)
-            if self.marketconfig.volume_tick:
-                assert isinstance(order["volume"], int)
+        # check that the products are part of an open auction
+        products = {
+            (order["start_time"], order["end_time"], order["only_hours"])
+            for order in sep_orders
+        }
+        if not products <= self.open_auctions:
+            raise ValueError("no open auction")
+
+        for field, values, tick in (
+            ("price", prices, self.marketconfig.price_tick),
+            ("volume", volumes, self.marketconfig.volume_tick),
+        ):
+            if not tick:
+                continue
+            for order, value in zip(sep_orders, values):
+                if type(value) is not int:
+                    raise ValueError(
+                        f"order {order.get('bid_id')} at {order['start_time']} - {field} {value} not in ticks"
+                    )
 
     def clear(
         self, orderbook: Orderbook, market_products: list[MarketProduct]
@@ -153,6 +214,9 @@ class MarketRole(MarketMechanism, Role):
     This is the base class for all market roles. It implements the basic functionality of a market role, such as
     registering agents, clearing the market and sending the results to the database agent.
 
+    The results of several clearings can be sent to the database agent in one message
+    by setting "write_batch_size" in the param_dict of the market configuration.
+
     Args:
         marketconfig (MarketConfig): The configuration of the market.
 
@@ -170,23 +234,32 @@ class MarketRole(MarketMechanism, Role):
         super().__init__(marketconfig)
         self.registered_agents = {}
         if marketconfig.price_tick:
-            if marketconfig.maximum_bid_price % marketconfig.price_tick != 0:
+            price_tick = to_fraction(marketconfig.price_tick)
+            if to_fraction(marketconfig.maximum_bid_price) % price_tick != 0:
                 logger.warning(
                     f"{marketconfig.market_id} - max price not a multiple of tick size"
                 )
-            if marketconfig.minimum_bid_price % marketconfig.price_tick != 0:
+            if to_fraction(marketconfig.minimum_bid_price) % price_tick != 0:
                 logger.warning(
                     f"{marketconfig.market_id} - min price not a multiple of tick size"
                 )
 
         if marketconfig.volume_tick and marketconfig.maximum_bid_volume:
-            if marketconfig.maximum_bid_volume % marketconfig.volume_tick != 0:
+            volume_tick = to_fraction(marketconfig.volume_tick)
+            if to_fraction(marketconfig.maximum_bid_volume) % volume_tick != 0:
                 logger.warning(
                     f"{marketconfig.market_id} - max volume not a multiple of tick size"
                 )
 
         self.grid_data = marketconfig.param_dict.get("grid_data")
 
+        # results are buffered and sent to the output agent every write_batch_size clearings
+        self.write_batch_size = marketconfig.param_dict.get("write_batch_size", 1)
+        self._pending_clearings = 0
+        self._pending_order_book: Orderbook = []
+        self._pending_market_results: list[dict] = []
+        self._reopens = True
+
     def setup(self):
         """
         This method sets up the initial configuration and subscriptions for the market role.
@@ -201,16 +274,15 @@ class MarketRole(MarketMechanism, Role):
         Schedules the opening() method to run at the next opening time of the market.
 
         Raises:
-            AssertionError: If a required field is missing.
+            ValueError: If a required field is missing.
         """
         super().setup()
         self.marketconfig.addr = self.context.addr
         self.marketconfig.aid = self.context.aid
 
         for field in self.required_fields:
-            assert (
-                field in self.marketconfig.additional_fields
-            ), f"{field} missing from additional_fiels"
+            if field not in self.marketconfig.additional_fields:
+                raise ValueError(f"{field} missing from additional_fiels")
 
         def accept_orderbook(content: OrderBookMessage, meta: MetaDict):
             if not isinstance(content, dict):
@@ -222,8 +294,7 @@ class MarketRole(MarketMechanism, Role):
             return (
                 content.get("market_id") == self.marketconfig.market_id
                 and content.get("orderbook") is not None
-                and (meta["sender_addr"], meta["sender_id"])
-                in self.registered_agents.keys()
+                and (meta["sender_addr"], meta["sender_id"]) in self.registered_agents
             )
 
         def accept_registration(content: RegistrationMessage, meta: MetaDict):
@@ -290,7 +361,8 @@ class MarketRole(MarketMechanism, Role):
 
         """
         # scheduled to be opened now
-        market_open = timestamp2datetime(self.context.current_timestamp)
+        opening_ts = self.context.current_timestamp
+        market_open = timestamp2datetime(opening_ts)
         market_closing = market_open + self.marketconfig.opening_duration
         products = get_available_products(
             self.marketconfig.market_products, market_open
@@ -308,29 +380,41 @@ class MarketRole(MarketMechanism, Role):
             "products": products,
         }
 
-        self.open_auctions |= set(opening_message["products"])
+        self.open_auctions.update(products)
 
-        for agent in self.registered_agents.keys():
-            agent_addr, agent_id = agent
-            await self.context.send_acl_message(
-                opening_message,
-                receiver_addr=agent_addr,
-                receiver_id=agent_id,
-                acl_metadata={
-                    "sender_addr": self.context.addr,
-                    "sender_id": self.context.aid,
-                    "reply_with": f"{self.marketconfig.market_id}_{market_open}",
-                },
-            )
+        # mango copies the metadata, so it can be shared by all messages
+        meta = {
+            "sender_addr": self.context.addr,
+            "sender_id": self.context.aid,
+            "reply_with": f"{self.marketconfig.market_id}_{market_open}",
+        }
+        # the messages to the agents are independent of each other
+        send_acl_message = self.context.send_acl_message
+        await asyncio.gather(
+            *[
+                send_acl_message(
+                    opening_message,
+                    receiver_addr=agent_addr,
+                    receiver_id=agent_id,
+                    acl_metadata=meta,
+                )
+                for agent_addr, agent_id in self.registered_agents
+            ]
+        )
 
         # schedule closing this market
-        closing_ts = datetime2timestamp(market_closing)
+        # timestamps are calculated as offsets to avoid converting datetimes back
+        closing_ts = opening_ts + (market_closing - market_open).total_seconds()
         self.context.schedule_timestamp_task(self.clear_market(products), closing_ts)
 
         # schedule the next opening too
         next_opening = self.marketconfig.opening_hours.after(market_open)
+        # buffered results have to be written with the last clearing
+        self._reopens = bool(next_opening) and not (
+            until and next_opening + self.marketconfig.opening_duration > until
+        )
         if next_opening:
-            next_opening_ts = datetime2timestamp(next_opening)
+            next_opening_ts = opening_ts + (next_opening - market_open).total_seconds()
             self.context.schedule_timestamp_task(self.opening(), next_opening_ts)
             logger.debug(
                 f"market opening: %s - %s - %s",
@@ -383,15 +467,20 @@ class MarketRole(MarketMechanism, Role):
             meta (MetaDict): The metadata of the message.
 
         Raises:
-            AssertionError: If the order book is invalid.
+            ValueError: If the order book is invalid.
         """
         orderbook: Orderbook = content["orderbook"]
         agent_addr = meta["sender_addr"]
         agent_id = meta["sender_id"]
         try:
             self.validate_orderbook(orderbook, (agent_addr, agent_id))
+            all_orders_append = self.all_orders.append
+            orders_by_product = self.orders_by_product
             for order in orderbook:
-                self.all_orders.append(order)
+                all_orders_append(order)
+                orders_by_product[
+                    (order["start_time"], order["end_time"], order["only_hours"])
+                ].append(order)
         except Exception as e:
             logger.error(f"error handling message from {agent_id} - {e}")
             self.context.schedule_instant_acl_message(
@@ -414,7 +503,7 @@ class MarketRole(MarketMechanism, Role):
             meta (MetaDict): The metadata of the message.
 
         Raises:
-            AssertionError: If the order book is invalid.
+            ValueError: If the order book is invalid.
         """
         metric_type = content["metric"]
         start = content["start_time"]
@@ -452,21 +541,14 @@ class MarketRole(MarketMechanism, Role):
             meta (MetaDict): The metadata of the message.
 
         Raises:
-            AssertionError: If the order book is invalid.
+            ValueError: If the order book is invalid.
         """
         order = content.get("order")
         agent_addr = meta["sender_addr"]
         agent_id = meta["sender_id"]
         if order:
-
-            def order_matches_req(o):
-                return (
-                    o["start_time"] == order["start_time"]
-                    and o["end_time"] == order["end_time"]
-                    and o["only_hours"] == order["only_hours"]
-                )
-
-            available_orders = list(filter(order_matches_req, self.all_orders))
+            product = (order["start_time"], order["end_time"], order["only_hours"])
+            available_orders = list(self.orders_by_product.get(product, []))
         else:
             available_orders = self.all_orders
 
@@ -495,6 +577,7 @@ class MarketRole(MarketMechanism, Role):
         ) = self.clear(self.all_orders, market_products)
 
         self.all_orders = []
+        self.orders_by_product = defaultdict(list)
 
         for order in rejected_orderbook:
             if "accepted_volume" not in order and "accepted_price" not in order:
@@ -510,42 +593,56 @@ class MarketRole(MarketMechanism, Role):
                     order["accepted_volume"] = 0.0
                     order["accepted_price"] = market_meta[0]["price"]
 
-        self.open_auctions - set(market_products)
+        # the cleared products are closed, so the open auctions do not grow
+        # for the lifetime of the simulation
+        self.open_auctions -= set(market_products)
 
-        accepted_orderbook.sort(key=itemgetter("agent_id"))
-        rejected_orderbook.sort(key=itemgetter("agent_id"))
+        accepted_orders = defaultdict(list)
+        for order in accepted_orderbook:
+            accepted_orders[order["agent_id"]].append(order)
+        rejected_orders = defaultdict(list)
+        for order in rejected_orderbook:
+            rejected_orders[order["agent_id"]].append(order)
 
-        accepted_orders = {
-            agent: list(bids)
-            for agent, bids in groupby(accepted_orderbook, itemgetter("agent_id"))
-        }
-        rejected_orders = {
-            agent: list(bids)
-            for agent, bids in groupby(rejected_orderbook, itemgetter("agent_id"))
-        }
+        # empty clearings are common for illiquid products, all agents then
+        # share the same empty closing which still triggers their dispatch
+        empty_closing: ClearingMessage | None = None
+        if not accepted_orders and not rejected_orders:
+            empty_closing = {
+                "context": "clearing",
+                "market_id": self.marketconfig.market_id,
+                "accepted_orders": [],
+                "rejected_orders": [],
+            }
 
-        for agent in self.registered_agents.keys():
+        meta = {"sender_addr": self.context.addr, "sender_id": self.context.aid}
+        market_id = self.marketconfig.market_id
+        send_acl_message = self.context.send_acl_message
+        sends = []
+        for agent in self.registered_agents:
             addr, aid = agent
-            meta = {"sender_addr": self.context.addr, "sender_id": self.context.aid}
-            closing: ClearingMessage = {
+            closing: ClearingMessage = empty_closing or {
                 "context": "clearing",
-                "market_id": self.marketconfig.market_id,
+                "market_id": market_id,
                 "accepted_orders": accepted_orders.get(agent, []),
                 "rejected_orders": rejected_orders.get(agent, []),
             }
-            await self.context.send_acl_message(
-                closing,
-                receiver_addr=addr,
-                receiver_id=aid,
-                acl_metadata=meta,
+            sends.append(
+                send_acl_message(
+                    closing,
+                    receiver_addr=addr,
+                    receiver_id=aid,
+                    acl_metadata=meta,
+                )
             )
+        await asyncio.gather(*sends)
         # store order book in db agent
         if not accepted_orderbook:
             logger.warning(
                 f"{self.context.current_timestamp} Market result {market_products} for market {self.marketconfig.market_id} are empty!"
             )
-        all_orders = accepted_orderbook + rejected_orderbook
-        await self.store_order_book(all_orders)
+        self._pending_order_book.extend(accepted_orderbook)
+        self._pending_order_book.extend(rejected_orderbook)
 
         for meta in market_meta:
             logger.debug(
@@ -558,10 +655,34 @@ class MarketRole(MarketMechanism, Role):
             meta["time"] = meta["product_start"]
             self.results.append(meta)
 
-        await self.store_market_results(market_meta)
+        self._pending_market_results.extend(market_meta)
+        self._pending_clearings += 1
+        if self._pending_clearings >= self.write_batch_size or not self._reopens:
+            await self.write_pending_results()
 
         return accepted_orderbook, market_meta
 
+    async def on_stop(self):
+        """
+        Sends the results which are still buffered when the simulation ends to the database agent.
+        """
+        await super().on_stop()
+        if self._pending_clearings:
+            await self.write_pending_results()
+
+    async def write_pending_results(self):
+        """
+        Sends the buffered order books and market results of the last clearings to the database agent.
+        """
+        order_book = self._pending_order_book
+        market_results = self._pending_market_results
+        self._pending_clearings = 0
+        self._pending_order_book = []
+        self._pending_market_results = []
+
+        await self.store_order_book(order_book)
+        await self.store_market_results(market_results)
+
     async def store_order_book(self, orderbook: Orderbook):
         # Send a message to the OutputRole to update data in the database
         """
@@ -7,14 +7,15 @@ from datetime import timedelta
 from operator import itemgetter
 
 import pyomo.environ as pyo
-from pyomo.opt import SolverFactory, TerminationCondition, check_available_solvers
+from pyomo.opt import SolverFactory, TerminationCondition
 
 from assume.common.market_objects import MarketConfig, MarketProduct, Orderbook
+from assume.common.utils import get_available_solver
 from assume.markets.base_market import MarketRole
 
 log = logging.getLogger(__name__)
 
-SOLVERS = ["gurobi", "glpk"]
+SOLVERS = ("gurobi", "glpk")
 EPS = 1e-4
 
 
@@ -126,18 +127,19 @@ def market_clearing_opt(
                     model.xb[order["bid_id"]] <= model.x[order["bid_id"]]
                 )
     # add energy balance constraint
-    balance_expr = {t: 0.0 for t in model.T}
+    # collect the terms per hour and sum them once with quicksum
+    balance_terms = {t: [] for t in model.T}
     for order in orders:
         if order["bid_type"] == "SB":
-            balance_expr[order["start_time"]] += (
+            balance_terms[order["start_time"]].append(
                 order["volume"] * model.xs[order["bid_id"]]
             )
         elif order["bid_type"] in ["BB", "LB"]:
             for start_time, volume in order["volume"].items():
-                balance_expr[start_time] += volume * model.xb[order["bid_id"]]
+                balance_terms[start_time].append(volume * model.xb[order["bid_id"]])
 
     def energy_balance_rule(m, t):
-        return balance_expr[t] == 0
+        return pyo.quicksum(balance_terms[t]) == 0
 
     model.energy_balance = pyo.Constraint(model.T, rule=energy_balance_rule)
 
@@ -152,22 +154,23 @@ def market_clearing_opt(
                 )
 
     # define the objective function as cost minimization
-    obj_expr = 0
+    obj_terms = []
     for order in orders:
         if order["bid_type"] == "SB":
-            obj_expr += order["price"] * order["volume"] * model.xs[order["bid_id"]]
+            obj_terms.append(
+                order["price"] * order["volume"] * model.xs[order["bid_id"]]
+            )
         elif order["bid_type"] in ["BB", "LB"]:
-            for start_time, volume in order["volume"].items():
-                obj_expr += order["price"] * volume * model.xb[order["bid_id"]]
-
-    model.objective = pyo.Objective(expr=obj_expr, sense=pyo.minimize)
+            # block bids have a single price, one term with the total volume suffices
+            obj_terms.append(
+                order["price"]
+                * sum(order["volume"].values())
+                * model.xb[order["bid_id"]]
+            )
 
-    # check available solvers, gurobi is preferred
-    solvers = check_available_solvers(*SOLVERS)
-    if len(solvers) < 1:
-        raise Exception(f"None of {SOLVERS} are available")
+    model.objective = pyo.Objective(expr=pyo.quicksum(obj_terms), sense=pyo.minimize)
 
-    solver = SolverFactory(solvers[0])
+    solver = SolverFactory(get_available_solver(SOLVERS))
 
     if solver.name == "gurobi":
         options = {"cutoff": -1.0, "MIPGap": EPS}
@@ -184,21 +187,20 @@ def market_clearing_opt(
         options = {}
 
     # Solve the model
-    instance = model.create_instance()
-    results = solver.solve(instance, options=options)
+    results = solver.solve(model, options=options)
 
     # fix all model.x to the values in the solution
     if mode == "with_min_acceptance_ratio":
         # add dual suffix to the model (we need this to extract the market clearing prices later)
-        instance.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT_EXPORT)
+        model.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT_EXPORT)
 
-        for bid_id in instance.Bids:
-            instance.x[bid_id].fix(instance.x[bid_id].value)
+        for bid_id in model.Bids:
+            model.x[bid_id].fix(model.x[bid_id].value)
 
         # resolve the model
-        results = solver.solve(instance, options=options)
+        results = solver.solve(model, options=options)
 
-    return instance, results
+    return model, results
 
 
 class ComplexClearingRole(MarketRole):
@@ -228,27 +230,26 @@ class ComplexClearingRole(MarketRole):
             agent_tuple (tuple[str, str]): The agent tuple of the market (agend_adrr, agent_id).
 
         Raises:
-            AssertionError: If the bid type is not valid or the volumes are not within the maximum bid volume.
+            ValueError: If the bid type is not valid or the volumes are not within the maximum bid volume.
         """
 
         super().validate_orderbook(orderbook, agent_tuple)
         max_volume = self.marketconfig.maximum_bid_volume
         for order in orderbook:
             order["bid_type"] = "SB" if order["bid_type"] is None else order["bid_type"]
-            assert order["bid_type"] in [
-                "SB",
-                "BB",
-                "LB",
-            ], f"bid_type {order['bid_type']} not in ['SB', 'BB', 'LB']"
+            if order["bid_type"] not in ["SB", "BB", "LB"]:
+                raise ValueError(
+                    f"bid_type {order['bid_type']} not in ['SB', 'BB', 'LB']"
+                )
 
+            if max_volume is None:
+                continue
             if order["bid_type"] in ["BB", "LB"]:
-                assert False not in [
-                    abs(volume) <= max_volume for _, volume in order["volume"].items()
-                ], f"max_volume {order['volume']}"
-            elif order["bid_type"] == "SB":
-                assert (
-                    abs(order["volume"]) <= max_volume
-                ), f"max_volume {order['volume']}"
+                volumes = order["volume"].values()
+            else:
+                volumes = [order["volume"]]
+            if any(abs(volume) > max_volume for volume in volumes):
+                raise ValueError(f"max_volume {order['volume']}")
 
     def clear(
         self, orderbook: Orderbook, market_products
@@ -456,8 +457,8 @@ def extract_results(
     accepted_orders: Orderbook = []
     meta = []
 
-    supply_volume_dict = {t: 0.0 for t in model.T}
-    demand_volume_dict = {t: 0.0 for t in model.T}
+    supply_volume_dict = dict.fromkeys(model.T, 0.0)
+    demand_volume_dict = dict.fromkeys(model.T, 0.0)
 
     for order in orders:
         if order["bid_type"] == "SB":
@@ -21,16 +21,17 @@ from pyomo.environ import (
     quicksum,
 )
 from pyomo.environ import value as get_real_number
-from pyomo.opt import SolverFactory, check_available_solvers
+from pyomo.opt import SolverFactory
 
 from assume.common.market_objects import MarketConfig, MarketProduct, Order, Orderbook
+from assume.common.utils import get_available_solver
 from assume.markets.base_market import MarketRole
 
 log = logging.getLogger(__name__)
 
-SOLVERS = ["glpk", "cbc", "gurobi", "cplex"]
+SOLVERS = ("glpk", "cbc", "gurobi", "cplex")
 
-order_types = ["single_ask", "single_bid", "linked_ask", "exclusive_ask"]
+order_types = ("single_ask", "single_bid", "linked_ask", "exclusive_ask")
 
 
 class ComplexDmasClearingRole(MarketRole):
@@ -56,7 +57,7 @@ class ComplexDmasClearingRole(MarketRole):
         """
         start = market_products[0][0]
         T = len(market_products)
-        t_range = np.arange(T)
+        t_range = range(T)
         # Orders have (block, hour, name) as key and (price, volume, link) as values
         orders = {type_: {} for type_ in order_types}
         # Index Orders have t as key and (block, name) as value
@@ -66,10 +67,7 @@ class ComplexDmasClearingRole(MarketRole):
         start_block = []
         model = ConcreteModel("dmas_market")
         # Create a solver
-        solvers = check_available_solvers(*SOLVERS)
-        if len(solvers) < 1:
-            raise Exception(f"None of {SOLVERS} are available")
-        opt = SolverFactory(solvers[0])
+        opt = SolverFactory(get_available_solver(SOLVERS))
 
         bid_ids = {}
 
@@ -218,44 +216,49 @@ class ComplexDmasClearingRole(MarketRole):
             )
 
         def get_volume(type_: str, hour: int):
+            # resolve the orders and variables of the type once instead of per term
+            type_orders = orders[type_]
+            hour_orders = index_orders[type_][hour]
             if type_ == "single_bid":
                 return quicksum(
-                    orders[type_][block, hour, name][1]
-                    for block, name in index_orders[type_][hour]
+                    type_orders[block, hour, name][1] for block, name in hour_orders
                 )
-            elif type_ == "exclusive_ask":
+            type_vars = model_vars[type_]
+            if type_ == "exclusive_ask":
                 return quicksum(
-                    orders[type_][block, hour, name][1] * model_vars[type_][block, name]
-                    for block, name in index_orders[type_][hour]
+                    type_orders[block, hour, name][1] * type_vars[block, name]
+                    for block, name in hour_orders
                 )
             else:
                 return quicksum(
-                    orders[type_][block, hour, name][1]
-                    * model_vars[type_][block, hour, name]
-                    for block, name in index_orders[type_][hour]
+                    type_orders[block, hour, name][1] * type_vars[block, hour, name]
+                    for block, name in hour_orders
                 )
 
         def get_cost(type_: str, hour: int):
+            type_orders = orders[type_]
+            hour_orders = index_orders[type_][hour]
             if type_ == "single_bid":
                 return quicksum(
-                    orders[type_][block, hour, name][0]
-                    * orders[type_][block, hour, name][1]
-                    for block, name in index_orders[type_][hour]
+                    type_orders[block, hour, name][0]
+                    * type_orders[block, hour, name][1]
+                    for block, name in hour_orders
                 )
-            elif type_ == "exclusive_ask":
+            type_vars = model_vars[type_]
+            if type_ == "exclusive_ask":
                 return quicksum(
-                    orders[type_][block, hour, name][0]
-                    * orders[type_][block, hour, name][1]
-                    * model_vars[type_][block, name]
-                    for block, name in index_orders[type_][hour]
-                    if orders[type_][block, hour, name][1] > 0
+                    type_orders[block, hour, name][0]
+                    * type_orders[block, hour, name][1]
+                    * type_vars[block, name]
+                    for block, name in hour_orders
+                    if type_orders[block, hour, name][1] > 0
                 )
             else:
                 return quicksum(
-                    orders[type_][block, hour, name][0]
-                    * orders[type_][block, hour, name][1]
-                    * model_vars[type_][block, hour, name]
-                    for block, name in index_orders[type_][hour]
+                    type_orders[block, hour, name][0]
+                    * type_orders[block, hour, name][1]
+                    * type_vars[block, hour, name]
+                    for block, name in hour_orders
                 )
 
         magic_source = [
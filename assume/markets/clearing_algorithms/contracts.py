@@ -668,4 +668,4 @@ available_contracts: dict[str, Callable] = {
     "FIT": feed_in_tariff,
     "MPFIX": market_premium,
 }
-contract_needs_market = ["CFD", "MPFIX"]
+contract_needs_market = ("CFD", "MPFIX")
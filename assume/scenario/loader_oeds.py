@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import logging
 import os
 import shutil
 from datetime import datetime, timedelta
@@ -15,6 +16,8 @@ from assume.common.forecasts import NaiveForecast
 from assume.common.market_objects import MarketConfig, MarketProduct
 from assume.scenario.oeds.infrastructure import InfrastructureInterface
 
+log = logging.getLogger(__name__)
+
 
 async def load_oeds_async(
     world: World,
@@ -47,7 +50,7 @@ async def load_oeds_async(
         freq="h",
     )
     sim_id = f"{scenario}_{study_case}"
-    print(f"loading scenario {sim_id}")
+    log.info(f"loading scenario {sim_id}")
     infra_interface = InfrastructureInterface("test", infra_uri)
 
     if not nuts_config:
@@ -80,10 +83,10 @@ async def load_oeds_async(
 
     # for each area - add demand and generation
     for area in nuts_config:
-        print(f"loading config {area} for {year}")
+        log.debug(f"loading config {area} for {year}")
         config_path = Path.home() / ".assume" / f"{area}_{year}"
         if not config_path.is_dir():
-            print(f"query database time series")
+            log.debug("query database time series")
             demand = infra_interface.get_demand_series_in_area(area, year)
             demand = demand.resample("h").mean()
             # demand in MW
@@ -97,12 +100,12 @@ async def load_oeds_async(
                 demand.to_csv(config_path / "demand.csv")
                 solar.to_csv(config_path / "solar.csv")
                 if isinstance(wind, float):
-                    print(wind, area, year)
+                    log.warning(f"got constant wind {wind} for {area} in {year}")
                 wind.to_csv(config_path / "wind.csv")
             except Exception:
                 shutil.rmtree(config_path, ignore_errors=True)
         else:
-            print(f"use existing local time series")
+            log.debug("use existing local time series")
             demand = pd.read_csv(config_path / "demand.csv", index_col=0).squeeze()
             solar = pd.read_csv(config_path / "solar.csv", index_col=0).squeeze()
             wind = pd.read_csv(config_path / "wind.csv", index_col=0).squeeze()
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import logging
 from datetime import datetime, timedelta
 
 import holidays
@@ -25,6 +26,8 @@ from assume.scenario.oeds.static import (
     technical_parameter,
 )
 
+log = logging.getLogger(__name__)
+
 WEATHER_PARAMS_ECMWF = [
     "temp_air",
     "ghi",
@@ -572,7 +575,7 @@ class InfrastructureInterface:
         if df.empty:
             return df
 
-        print(df["name"])
+        log.debug("water storages in %s: %s", area, df["name"].tolist())
         # set charge and discharge power
         df["PPlus_max"] = df["PPlus_max"].fillna(
             df["PMinus_max"]
@@ -855,7 +858,7 @@ def get_solar_series(solar_systems: pd.DataFrame, weather_df: pd.DataFrame):
 def get_pwp_agents(interface, areas):
     pwp_agents = []
     for area in areas:
-        print(area)
+        log.debug("checking power plants in %s", area)
         plants = False
         for fuel in ["lignite", "gas", "oil", "hard coal", "nuclear"]:
             df = interface.get_power_plant_in_area(area=area, fuel_type=fuel)
@@ -870,7 +873,7 @@ def get_pwp_agents(interface, areas):
 def get_res_agents(interface, areas):
     res_agents = []
     for area in areas:
-        print(area)
+        log.debug("checking renewables in %s", area)
         wind = interface.get_wind_turbines_in_area(area=area)
         solar = interface.get_solar_storage_systems_in_area(area=area)
         bio = interface.get_biomass_systems_in_area(area=area)
@@ -883,13 +886,13 @@ def get_res_agents(interface, areas):
 def get_storage_agents(interface, areas):
     str_agents = []
     for area in areas:
-        print(area)
+        log.debug("checking storages in %s", area)
         str = interface.get_water_storage_systems(area)
         if str.empty:
             continue
         # print(str['name'])
         if any(str["PMinus_max"] > 1) and any(str["VMax"] > 1):
-            print(f"add {area}")
+            log.debug("add storage agent %s", area)
             str_agents.append(area)
     return str_agents
 
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from pyomo.environ import (
     Binary,
     ConcreteModel,
@@ -14,55 +15,51 @@ from pyomo.environ import (
     ConstraintList,
     NonNegativeReals,
     Objective,
+    RangeSet,
     Reals,
     Var,
     maximize,
     quicksum,
     value,
 )
-from pyomo.opt import (
-    SolverFactory,
-    SolverStatus,
-    TerminationCondition,
-    check_available_solvers,
-)
+from pyomo.opt import SolverFactory, SolverStatus, TerminationCondition
 
 from assume.common.base import BaseStrategy, SupportsMinMax
 from assume.common.market_objects import MarketConfig, Orderbook, Product
+from assume.common.utils import get_available_solver
 
 log = logging.getLogger(__name__)
 
 
-def get_solver_factory(solvers_str=["cbc", "glpk", "cbc", "gurobi", "cplex"]):
+def get_values(var) -> np.ndarray:
     """
-    select the first available solver from the list
+    returns the values of an indexed variable in the order of its index
 
     Args:
-      solvers_str(list, optional): list of solvers
+      var(pyomo.core.base.var.IndexedVar): solved model variable
 
     Returns:
-      SolverFactory: solver factory
+      np.ndarray: values of the variable
 
     """
-    solvers = check_available_solvers(*solvers_str)
-    if len(solvers) < 1:
-        raise Exception(f"None of {solvers_str} are available")
-    return SolverFactory(solvers[0])
+    return np.asarray(list(var.extract_values().values()))
 
 
 class DmasPowerplantStrategy(BaseStrategy):
-    def __init__(self, steps=[-10, -1, 0, 1, 10], *args, **kwargs):
+    def __init__(self, steps=(-10, -1, 0, 1, 10), *args, **kwargs):
         """
         Initializes the strategy
 
         Args:
-            steps (list): list of steps to optimize
+            steps (tuple): price steps to optimize
             *args (list): additional arguments
             **kwargs (dict): additional keyword arguments
         """
         super().__init__(*args, **kwargs)
         self.model = ConcreteModel("powerplant")
-        self.opt = get_solver_factory()
+        self.opt = SolverFactory(
+            get_available_solver(("cbc", "glpk", "gurobi", "cplex"))
+        )
         self.steps = steps
         self.T = 24
         self.opt_results = {
@@ -112,23 +109,26 @@ class DmasPowerplantStrategy(BaseStrategy):
         runtime = runtime or unit.get_operation_time(start)
         p0 = p0 or unit.get_output_before(start)
         self.model.clear()
-        tr = np.arange(hour_count)
+        # plain int indices, the model components are keyed and looked up by them
+        tr = range(hour_count)
+        # the hours as symbolic range, so the variables share it instead of each
+        # materializing its own index set
+        self.model.T = RangeSet(0, hour_count - 1)
 
         delta = unit.max_power - unit.min_power
 
-        self.model.p_out = Var(tr, bounds=(0, unit.max_power), within=Reals)
-        self.model.p_model = Var(tr, bounds=(0, delta), within=Reals)
+        self.model.p_out = Var(self.model.T, bounds=(0, unit.max_power), within=Reals)
+        self.model.p_model = Var(self.model.T, bounds=(0, delta), within=Reals)
 
         # states (on, ramp up, ramp down)
-        self.model.z = Var(tr, within=Binary)
-        self.model.v = Var(tr, within=Binary, initialize=False)
-        self.model.w = Var(tr, within=Binary, initialize=False)
+        self.model.z = Var(self.model.T, within=Binary)
+        self.model.v = Var(self.model.T, within=Binary, initialize=False)
+        self.model.w = Var(self.model.T, within=Binary, initialize=False)
 
         # define constraint for output power
         self.model.real_power = ConstraintList()
         self.model.real_max = ConstraintList()
-        # define constraint for model power
-        self.model.model_min = ConstraintList()
+        # define constraint for model power, its lower bound of 0 is the variable bound
         self.model.model_max = ConstraintList()
         # define constraint ramping
         self.model.ramping_up = ConstraintList()
@@ -140,82 +140,70 @@ class DmasPowerplantStrategy(BaseStrategy):
         self.model.initial_on = ConstraintList()
         self.model.initial_off = ConstraintList()
 
+        # local references to the model components used in the time loops below
+        model = self.model
+        p_out, p_model = model.p_out, model.p_model
+        z, v, w = model.z, model.v, model.w
+        min_power = unit.min_power
+
+        # the first and last hours are special cases, so each constraint
+        # iterates only over the hours it applies to instead of branching per hour
         for t in tr:  # iterate over hours to optimize
             # output power of the plant
-            self.model.real_power.add(
-                self.model.p_out[t]
-                == self.model.p_model[t] + self.model.z[t] * unit.min_power
-            )
-            if t < hour_count - 1:  # only the next day
-                self.model.real_max.add(
-                    self.model.p_out[t]
-                    <= unit.min_power
-                    * (self.model.z[t] + self.model.v[t + 1] + self.model.p_model[t])
-                )
+            model.real_power.add(p_out[t] == p_model[t] + z[t] * min_power)
             # model power for optimization
-            self.model.model_min.add(0 <= self.model.p_model[t])
-            self.model.model_max.add(self.model.z[t] * delta >= self.model.p_model[t])
-            # ramping (gradients)
-            if t == 0:
-                self.model.ramping_up_0 = Constraint(
-                    expr=self.model.p_out[0] <= p0 + unit.ramp_up
-                )
-                self.model.ramping_down_0 = Constraint(
-                    expr=self.model.p_out[0] >= p0 - unit.ramp_down
-                )
-            else:
-                self.model.ramping_up.add(
-                    self.model.p_model[t] - self.model.p_model[t - 1]
-                    <= unit.ramp_up * self.model.z[t - 1]
-                )
-                self.model.ramping_down.add(
-                    self.model.p_model[t - 1] - self.model.p_model[t]
-                    <= unit.ramp_down * self.model.z[t]
-                )
-            # minimal run and stop time
-            if t > unit.min_down_time:
-                self.model.stop_time.add(
-                    1 - self.model.z[t]
-                    >= quicksum(
-                        self.model.w[k] for k in range(t - unit.min_down_time, t)
-                    )
-                )
-            if t > unit.min_operating_time:
-                self.model.run_time.add(
-                    self.model.z[t]
-                    >= quicksum(
-                        self.model.v[k] for k in range(t - unit.min_operating_time, t)
-                    )
-                )
-            if t > 0:
-                self.model.states.add(
-                    self.model.z[t - 1]
-                    - self.model.z[t]
-                    + self.model.v[t]
-                    - self.model.w[t]
-                    == 0
-                )
-
-            if runtime > 0 and t < unit.min_operating_time - runtime:
-                self.model.initial_on.add(self.model.z[t] == 1)
-            elif runtime < 0 and t < unit.min_down_time - (-runtime):
-                self.model.initial_off.add(self.model.z[t] == 0)
+            model.model_max.add(z[t] * delta >= p_model[t])
+
+        for t in tr[:-1]:  # only the next day
+            model.real_max.add(p_out[t] <= min_power * (z[t] + v[t + 1] + p_model[t]))
+
+        # ramping (gradients)
+        model.ramping_up_0 = Constraint(expr=p_out[0] <= p0 + unit.ramp_up)
+        model.ramping_down_0 = Constraint(expr=p_out[0] >= p0 - unit.ramp_down)
+        for t in tr[1:]:
+            model.ramping_up.add(p_model[t] - p_model[t - 1] <= unit.ramp_up * z[t - 1])
+            model.ramping_down.add(p_model[t - 1] - p_model[t] <= unit.ramp_down * z[t])
+
+        # minimal run and stop time
+        for t in tr[unit.min_down_time + 1 :]:
+            model.stop_time.add(
+                1 - z[t] >= quicksum(w[k] for k in range(t - unit.min_down_time, t))
+            )
+        for t in tr[unit.min_operating_time + 1 :]:
+            model.run_time.add(
+                z[t] >= quicksum(v[k] for k in range(t - unit.min_operating_time, t))
+            )
+        for t in tr[1:]:
+            model.states.add(z[t - 1] - z[t] + v[t] - w[t] == 0)
+
+        if runtime > 0:
+            for t in tr[: max(unit.min_operating_time - runtime, 0)]:
+                model.initial_on.add(z[t] == 1)
+        elif runtime < 0:
+            for t in tr[: max(unit.min_down_time + runtime, 0)]:
+                model.initial_off.add(z[t] == 0)
+
+        # cost and price per MWh computed once for the whole horizon and converted
+        # to floats in one go instead of boxing numpy scalars per coefficient
+        fuel_price_per_mwh = (
+            np.asarray(fuel_prices)[:hour_count] / unit.efficiency
+        ).tolist()
+        emission_price_per_mwh = (
+            np.asarray(emission_prices)[:hour_count]
+            * unit.emission_factor
+            / unit.efficiency
+        ).tolist()
+        power_prices = np.asarray(power_prices)[:hour_count].tolist()
 
         # -> fuel costs
-        fuel_cost = [
-            (self.model.p_out[t] / unit.efficiency) * fuel_prices.iloc[t] for t in tr
-        ]
+        fuel_cost = [p_out[t] * fuel_price_per_mwh[t] for t in tr]
         # -> emission costs
-        emission_cost = [
-            (self.model.p_out[t] / unit.efficiency * unit.emission_factor)
-            * emission_prices.iloc[t]
-            for t in tr
-        ]
+        emission_cost = [p_out[t] * emission_price_per_mwh[t] for t in tr]
         # -> start costs
-        start_cost = [self.model.v[t] * unit.cold_start_cost for t in tr]
+        start_cost = [v[t] * unit.cold_start_cost for t in tr]
 
         # -> profit and resulting cashflow
-        profit = [self.model.p_out[t] * power_prices.iloc[t] for t in tr]
+        profit = [p_out[t] * power_prices[t] for t in tr]
         cashflow = [
             profit[t] - (fuel_cost[t] + emission_cost[t] + start_cost[t]) for t in tr
         ]
@@ -248,8 +236,7 @@ class DmasPowerplantStrategy(BaseStrategy):
 
         """
         # -> output power
-        tr = np.arange(hour_count)
-        power = np.asarray([self.model.p_out[t].value for t in tr])
+        power = get_values(self.model.p_out)
         self.opt_results[step]["power"] = power
         # TODO rounding really needed?
         self.opt_results[step]["power"][power < 0.1] = 0
@@ -261,8 +248,8 @@ class DmasPowerplantStrategy(BaseStrategy):
         # -> fuel costs
         self.opt_results[step]["fuel"] = power / unit.efficiency * fuel_prices
         # -> start costs
-        self.opt_results[step]["start"] = np.asarray(
-            [self.model.v[t].value * unit.cold_start_cost for t in tr]
+        self.opt_results[step]["start"] = (
+            get_values(self.model.v) * unit.cold_start_cost
         )
         # -> profit
         self.opt_results[step]["profit"] = power_prices * power
@@ -366,9 +353,8 @@ class DmasPowerplantStrategy(BaseStrategy):
                     total_obj_single = self.opt_results[step]["obj"] + value(
                         self.model.obj
                     )
-                    tr = np.arange(hour_count)
                     power_day1 = list(self.opt_results[step]["power"])
-                    power_day2 = [self.model.p_out[t].value for t in tr]
+                    power_day2 = get_values(self.model.p_out).tolist()
                     total_single_power = np.asarray(power_day1 + power_day2)
 
                     all_off = np.argwhere(total_single_power == 0).flatten()
@@ -384,10 +370,9 @@ class DmasPowerplantStrategy(BaseStrategy):
                         runtime,
                         p0,
                     )
-                    tr = np.arange(hour_count2)
                     self.model.obj = Objective(expr=quicksum(cashflow), sense=maximize)
                     self.opt.solve(self.model)
-                    power_check = np.asarray([self.model.p_out[t].value for t in tr])
+                    power_check = get_values(self.model.p_out)
                     prevent_start = all(power_check[prevented_off_hours] > 0)
                     delta = value(self.model.obj) - total_obj_single
                     if prevent_start and delta > 0:
@@ -457,23 +442,28 @@ class DmasPowerplantStrategy(BaseStrategy):
         ]
         self.optimize(unit, start, hour_count, base_price)
 
+        # fuel and emission price per unit of fuel, looked up by hour below
+        fuel_costs = fuel_price.to_numpy() + e_price.to_numpy() * unit.emission_factor
+
         def get_cost(p: float, t: int):
-            f = fuel_price.iloc[t]
-            e = e_price.iloc[t]
-            return (p / unit.efficiency) * (f + e * unit.emission_factor)
+            return (p / unit.efficiency) * fuel_costs[t]
 
         def get_marginal(p0: float, p1: float, t: int):
             marginal = (get_cost(p=p0, t=t) - get_cost(p=p1, t=t)) / (p0 - p1)
             return marginal, p1 - p0
 
         def get_maximal_profit_hours(base_price):
-            max_profit, start_hour = 0, 0
+            start_hour = 0
             run_time = unit.min_operating_time
-            for t in range(hour_count - run_time):
-                p = np.sum(unit.min_power * base_price[t : t + run_time])
-                if p > max_profit:
-                    max_profit = p
-                    start_hour = t
+            if hour_count > run_time:
+                # profit of running at min_power for run_time hours, for every start hour
+                windows = sliding_window_view(np.asarray(base_price), run_time)
+                profits = (unit.min_power * windows[: hour_count - run_time]).sum(
+                    axis=1
+                )
+                # the first start hour with the highest positive profit is used
+                if profits.max() > 0:
+                    start_hour = int(profits.argmax())
             return [
                 *range(
                     start_hour,
@@ -483,7 +473,7 @@ class DmasPowerplantStrategy(BaseStrategy):
 
         order_book, last_power, block_number = {}, np.zeros(hour_count), 0
         tr = np.arange(hour_count)
-        links = {i: None for i in tr}
+        links = dict.fromkeys(tr)
 
         max_hours = get_maximal_profit_hours(base_price)
         start_cost = unit.cold_start_cost / unit.min_power**2
@@ -751,12 +741,9 @@ class DmasPowerplantStrategy(BaseStrategy):
             df.loc[df["price"] < -500 / 1e3, "price"] = -500 / 1e3
         if not df.empty:
             df = df.reset_index()
-            df["start_time"] = df.apply(
-                lambda o: start + timedelta(hours=o["hour"]), axis=1
-            )
-            df["end_time"] = df.apply(
-                lambda o: start + timedelta(hours=o["hour"]) + unit.index.freq, axis=1
-            )
+            # shift all rows by their hour at once instead of a row-wise apply
+            df["start_time"] = start + pd.to_timedelta(df["hour"], unit="h")
+            df["end_time"] = df["start_time"] + unit.index.freq
             del df["hour"]
             df["exclusive_id"] = None
         return df.to_dict("records")
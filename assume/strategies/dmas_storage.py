@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 import numpy as np
 import pandas as pd
@@ -10,15 +11,19 @@ from pyomo.environ import (
     ConcreteModel,
     ConstraintList,
     Objective,
+    Param,
+    RangeSet,
     Reals,
     Var,
     maximize,
     quicksum,
 )
-from pyomo.opt import SolverFactory, check_available_solvers
+from pyomo.opt import SolverFactory
 
 from assume.common.base import BaseStrategy, SupportsMinMaxCharge
 from assume.common.market_objects import MarketConfig, Orderbook, Product
+from assume.common.utils import get_available_solver
+from assume.strategies.dmas_powerplant import get_values
 
 
 def shift(prc, type_: str = "first"):
@@ -78,35 +83,18 @@ def shaping(prc, type_: str = "peak"):
     return prc
 
 
-PRICE_FUNCS = {
-    "left": lambda prc: np.roll(prc, -1),
-    "right": lambda prc: np.roll(prc, 1),
-    "normal": lambda prc: prc,
-    # 'first': lambda prc: shift(prc, type_='first'),
-    # 'last': lambda prc: shift(prc, type_='last'),
-    # 'peak_off_peak': lambda prc: shaping(prc, type_='peak'),
-    "pv_sink:": lambda prc: shaping(prc, type_="pv"),
-    "demand": lambda prc: shaping(prc, type_="demand"),
-}
-
-
-def get_solver_factory(solvers_str=["glpk", "cbc", "gurobi", "cplex"]) -> SolverFactory:
-    """
-    Returns the first available solver from the list of solvers
-
-    Args:
-        solvers_str (list, optional): default solvers. Defaults to ["glpk", "cbc", "gurobi", "cplex"].
-
-    Raises:
-        Exception: if no solvers available
-
-    Returns:
-        SolverFactory: the first working solver
-    """
-    solvers = check_available_solvers(*solvers_str)
-    if len(solvers) < 1:
-        raise Exception(f"None of {solvers_str} are available")
-    return SolverFactory(solvers[0])
+PRICE_FUNCS = MappingProxyType(
+    {
+        "left": lambda prc: np.roll(prc, -1),
+        "right": lambda prc: np.roll(prc, 1),
+        "normal": lambda prc: prc,
+        # 'first': lambda prc: shift(prc, type_='first'),
+        # 'last': lambda prc: shift(prc, type_='last'),
+        # 'peak_off_peak': lambda prc: shaping(prc, type_='peak'),
+        "pv_sink:": lambda prc: shaping(prc, type_="pv"),
+        "demand": lambda prc: shaping(prc, type_="demand"),
+    }
+)
 
 
 class DmasStorageStrategy(BaseStrategy):
@@ -116,7 +104,9 @@ class DmasStorageStrategy(BaseStrategy):
         super().__init__(*args, **kwargs)
 
         self.model = ConcreteModel("storage")
-        self.opt = get_solver_factory()
+        self.opt = SolverFactory(
+            get_available_solver(("glpk", "cbc", "gurobi", "cplex"))
+        )
 
     def build_model(self, unit: SupportsMinMaxCharge, start: datetime, hour_count: int):
         """
@@ -133,18 +123,26 @@ class DmasStorageStrategy(BaseStrategy):
         """
         self.model.clear()
         time_range = range(hour_count)
+        # the hours as symbolic range shared by all indexed components
+        self.model.T = RangeSet(0, hour_count - 1)
 
         self.model.p_plus = Var(
-            time_range, within=Reals, bounds=(0, -unit.max_power_charge)
+            self.model.T, within=Reals, bounds=(0, -unit.max_power_charge)
         )
         self.model.p_minus = Var(
-            time_range, within=Reals, bounds=(0, unit.max_power_discharge)
+            self.model.T, within=Reals, bounds=(0, unit.max_power_discharge)
+        )
+        self.model.volume = Var(self.model.T, within=Reals, bounds=(0, unit.max_volume))
+
+        # local references to the model components used in the time loops below
+        p_plus, p_minus, volume = (
+            self.model.p_plus,
+            self.model.p_minus,
+            self.model.volume,
         )
-        self.model.volume = Var(time_range, within=Reals, bounds=(0, unit.max_volume))
 
         self.power = [
-            -self.model.p_minus[t] / unit.efficiency_discharge
-            + self.model.p_plus[t] * unit.efficiency_charge
+            -p_minus[t] / unit.efficiency_discharge + p_plus[t] * unit.efficiency_charge
             for t in time_range
         ]
 
@@ -152,16 +150,13 @@ class DmasStorageStrategy(BaseStrategy):
         soc0 = unit.get_soc_before(start)
         v0 = unit.max_volume * soc0
 
-        for t in time_range:
-            if t == 0:
-                self.model.vol_con.add(self.model.volume[t] == v0 + self.power[t])
-            else:
-                self.model.vol_con.add(
-                    self.model.volume[t] == self.model.volume[t - 1] + self.power[t]
-                )
+        # the first hour starts from the initial volume, the others from the last hour
+        self.model.vol_con.add(volume[0] == v0 + self.power[0])
+        for t in time_range[1:]:
+            self.model.vol_con.add(volume[t] == volume[t - 1] + self.power[t])
 
         # always end with half full SoC
-        self.model.vol_con.add(self.model.volume[hour_count - 1] == unit.max_volume / 2)
+        self.model.vol_con.add(volume[hour_count - 1] == unit.max_volume / 2)
         return self.power
 
     def optimize(
@@ -189,23 +184,28 @@ class DmasStorageStrategy(BaseStrategy):
             start : start + timedelta(hours=hour_count)
         ]
 
+        # the constraints do not depend on the prices, so the model is built once
+        # and only the mutable prices of the objective are updated for each curve
+        self.power = self.build_model(unit, start, hour_count)
+        self.model.price = Param(
+            self.model.T, initialize=0.0, mutable=True, within=Reals
+        )
+        self.model.obj = Objective(
+            expr=quicksum(-self.power[t] * self.model.price[t] for t in time_range),
+            sense=maximize,
+        )
+
         for key, func in PRICE_FUNCS.items():
             prices = func(base_price.values)
-            self.power = self.build_model(unit, start, hour_count)
-            profit = [-self.power[t] * prices[t] for t in time_range]
-            self.model.obj = Objective(
-                expr=quicksum(profit[t] for t in time_range), sense=maximize
+            self.model.price.store_values(
+                dict(zip(time_range, prices[:hour_count].tolist()))
             )
             r = self.opt.solve(self.model)
-            power = np.asarray(
-                [
-                    -self.model.p_minus[t].value * unit.efficiency_discharge
-                    + self.model.p_plus[t].value
-                    for t in time_range
-                ]
-            )
-            profit = [-power[t] * prices[t] for t in time_range]
-            volume = np.asarray([self.model.volume[t].value for t in time_range])
+            p_minus = get_values(self.model.p_minus)
+            p_plus = get_values(self.model.p_plus)
+            power = -p_minus * unit.efficiency_discharge + p_plus
+            profit = -power * prices[:hour_count]
+            volume = get_values(self.model.volume)
             opt_results[key] = power
             if key == "normal":
                 end = start + unit.index.freq * (hour_count - 1)
@@ -253,22 +253,23 @@ class DmasStorageStrategy(BaseStrategy):
         )
         total_orders = {}
         block_id = 0
+        # positional lookups below work on the plain array instead of the Series
         power_prices = unit.forecaster[f"price_{market_config.market_id}"][
             start : start + timedelta(hours=hour_count)
-        ]
+        ].to_numpy()
         for key, power in opt_results.items():
             prc = np.zeros(hour_count)
             bid_hours = np.argwhere(power < 0).flatten()
             ask_hours = np.argwhere(power > 0).flatten()
             if len(bid_hours) > 1:
-                max_charging_price = power_prices.values[bid_hours].max()
+                max_charging_price = power_prices[bid_hours].max()
             else:
                 max_charging_price = 0
             min_discharging_price = max_charging_price / (
                 unit.efficiency_discharge * unit.efficiency_discharge
             )
-            prc[ask_hours] = (power_prices.iloc[ask_hours] + min_discharging_price) / 2
-            prc[bid_hours] = power_prices.values[bid_hours]
+            prc[ask_hours] = (power_prices[ask_hours] + min_discharging_price) / 2
+            prc[bid_hours] = power_prices[bid_hours]
             add = True
             for orders in total_orders.values():
                 if any(prc != orders["price"]) or any(power != orders["volume"]):
@@ -290,11 +291,8 @@ class DmasStorageStrategy(BaseStrategy):
 
         if not bids.empty:
             bids = bids.reset_index()
-            bids["start_time"] = bids.apply(
-                lambda o: start + timedelta(hours=o["hour"]), axis=1
-            )
-            bids["end_time"] = bids.apply(
-                lambda o: start + timedelta(hours=o["hour"]) + unit.index.freq, axis=1
-            )
+            # shift all rows by their hour at once instead of a row-wise apply
+            bids["start_time"] = start + pd.to_timedelta(bids["hour"], unit="h")
+            bids["end_time"] = bids["start_time"] + unit.index.freq
             del bids["hour"]
         return bids.to_dict("records")
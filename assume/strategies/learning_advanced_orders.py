@@ -78,6 +78,9 @@ class RLAdvancedOrderStrategy(LearningStrategy):
         # define allowed order types
         self.order_types = kwargs.get("order_types", ["SB"])
 
+        # scaled forecasts per market, which are sliced by position for each observation
+        self._scaled_forecasts = {}
+
         if self.learning_mode:
             self.learning_role = None
             self.collect_initial_experience_mode = kwargs.get(
@@ -154,39 +157,51 @@ class RLAdvancedOrderStrategy(LearningStrategy):
         bid_quantity_block = {}
         op_time = unit.get_operation_time(start)
 
-        for product in product_tuples:
+        # the values of all products are read at once and iterated by position
+        product_starts = [product[0] for product in product_tuples]
+        current_powers = unit.outputs["energy"].loc[product_starts].to_numpy()
+        min_powers = min_power.loc[product_starts].to_numpy()
+        max_powers = max_power.loc[product_starts].to_numpy()
+
+        # the ramping depends on the bids of the previous product, so it is calculated
+        # sequentially, everything which does not change between products is looked up once
+        calculate_ramp = unit.calculate_ramp
+        min_down_time = unit.min_down_time
+        use_block_bids = "BB" in self.order_types
+        use_linked_bids = "LB" in self.order_types
+
+        for i, product in enumerate(product_tuples):
             start = product[0]
             end = product[1]
+            current_power = current_powers[i]
 
             bid_quantity_inflex = 0
             bid_quantity_flex = 0
 
-            current_power = unit.outputs["energy"].at[start]
-
             # get technical bounds for the unit output from the unit
             # adjust for ramp speed
-            max_power[start] = unit.calculate_ramp(
-                op_time, previous_power, max_power[start], current_power
+            max_power_ramped = calculate_ramp(
+                op_time, previous_power, max_powers[i], current_power
             )
             # adjust for ramp speed
-            min_power[start] = unit.calculate_ramp(
-                op_time, previous_power, min_power[start], current_power
+            min_power_ramped = calculate_ramp(
+                op_time, previous_power, min_powers[i], current_power
             )
 
             # 3.1 formulate the bids for Pmin
-            bid_quantity_inflex = min_power[start]
+            bid_quantity_inflex = min_power_ramped
 
             # 3.1 formulate the bids for Pmax - Pmin
             # Pmin, the minium run capacity is the inflexible part of the bid, which should always be accepted
 
-            if op_time <= -unit.min_down_time or op_time > 0:
-                bid_quantity_flex = max_power[start] - bid_quantity_inflex
+            if op_time <= -min_down_time or op_time > 0:
+                bid_quantity_flex = max_power_ramped - bid_quantity_inflex
 
-            if "BB" in self.order_types:
+            if use_block_bids:
                 bid_quantity_block[start] = bid_quantity_inflex
 
             # if no BB in order_types, then add the inflex bid as SB
-            if "BB" not in self.order_types:
+            else:
                 bids.append(
                     {
                         "start_time": start,
@@ -201,8 +216,8 @@ class RLAdvancedOrderStrategy(LearningStrategy):
 
             # actually formulate bids in orderbook format
             # if LB is in order_types, then formulate the linked bid depending on the block bid or simple bid
-            if "LB" in self.order_types and bid_quantity_inflex != 0:
-                if "BB" in self.order_types:
+            if use_linked_bids and bid_quantity_inflex != 0:
+                if use_block_bids:
                     parent_bid_id = unit.id + "_block"
                 else:
                     parent_bid_id = f"{unit.id}_{len(bids)}"
@@ -235,10 +250,16 @@ class RLAdvancedOrderStrategy(LearningStrategy):
             # calculate previous power with planned dispatch (bid_quantity)
             previous_power = bid_quantity_inflex + bid_quantity_flex + current_power
             op_time = max(op_time, 0) + 1 if previous_power > 0 else min(op_time, 0) - 1
-            # store results in unit outputs which are written to database by unit operator
-            unit.outputs["rl_observations"][start] = next_observation
-            unit.outputs["rl_actions"][start] = actions
-            unit.outputs["rl_exploration_noise"][start] = noise
+
+        # store results in unit outputs which are written to database by unit operator
+        # the same observation and actions are used for all products
+        product_count = len(product_starts)
+        outputs = unit.outputs
+        outputs["rl_observations"].loc[product_starts] = [
+            next_observation
+        ] * product_count
+        outputs["rl_actions"].loc[product_starts] = [actions] * product_count
+        outputs["rl_exploration_noise"].loc[product_starts] = [noise] * product_count
 
         if "BB" in self.order_types:
             bids.append(
@@ -284,36 +305,40 @@ class RLAdvancedOrderStrategy(LearningStrategy):
             # to get a good initial experience, in the area around the costs of the agent
             if self.collect_initial_experience_mode:
                 # define current action as soley noise
-                noise = (
-                    th.normal(
-                        mean=0.0, std=0.2, size=(1, self.act_dim), dtype=self.float_type
-                    )
-                    .to(self.device)
-                    .squeeze()
+                # the noise is drawn on the device, it is not reused as it is stored in the outputs
+                noise = th.normal(
+                    mean=0.0,
+                    std=0.2,
+                    size=(self.act_dim,),
+                    dtype=self.float_type,
+                    device=self.device,
                 )
 
                 # =============================================================================
                 # 2.1 Get Actions and handle exploration
                 # =============================================================================
+                # only the marginal cost of the observation is used here, the full observation
+                # is still needed as the initial experience written to the replay buffer
                 base_bid = next_observation[-1]
 
                 # add noise to the last dimension of the observation
                 # needs to be adjusted if observation space is changed, because only makes sense
                 # if the last dimension of the observation space are the marginal cost
-                curr_action = noise + base_bid.clone().detach()
+                curr_action = noise + base_bid
 
             else:
                 # if we are not in the initial exploration phase we chose the action with the actor neuronal net
                 # and add noise to the action
-                curr_action = self.actor(next_observation).detach()
-                noise = th.tensor(
-                    self.action_noise.noise(), device=self.device, dtype=self.float_type
-                )
+                # no graph is needed, as the actor is trained on the buffered observations
+                with th.no_grad():
+                    curr_action = self.actor(next_observation)
+                noise = self.get_action_noise()
                 curr_action += noise
         else:
             # if we are not in learning mode we just use the actor neuronal net to get the action without adding noise
 
-            curr_action = self.actor(next_observation).detach()
+            with th.no_grad():
+                curr_action = self.actor(next_observation)
             noise = tuple(0 for _ in range(self.act_dim))
 
         curr_action = curr_action.clamp(-1, 1)
@@ -347,19 +372,9 @@ class RLAdvancedOrderStrategy(LearningStrategy):
             The scaling factors are defined by the maximum residual load, the maximum bid price
             and the maximum capacity of the unit.
         """
-        end_excl = end - unit.index.freq
-
-        # get the forecast length depending on the time unit considered in the modelled unit
-        forecast_len = pd.Timedelta((self.foresight - 1) * unit.index.freq)
-
         # =============================================================================
         # 1.1 Get the Observations, which are the basis of the action decision
         # =============================================================================
-        scaling_factor_res_load = self.max_demand
-
-        # price forecast
-        scaling_factor_price = self.max_bid_price
-
         # total capacity and marginal cost
         scaling_factor_total_capacity = unit.max_power
 
@@ -367,43 +382,32 @@ class RLAdvancedOrderStrategy(LearningStrategy):
         # Obs[2*foresight+1:2*foresight+2]
         scaling_factor_marginal_cost = self.max_bid_price
 
-        # checks if we are at end of simulation horizon, since we need to change the forecast then
-        # for residual load and price forecast and scale them
-        product_len = (end - start) / unit.index.freq
-        if (
-            end_excl + forecast_len
-            > unit.forecaster[f"residual_load_{market_id}"].index[-1]
-        ):
-            scaled_res_load_forecast = (
-                unit.forecaster[f"residual_load_{market_id}"][
-                    -int(product_len + self.foresight - 1) :
-                ].values
-                / scaling_factor_res_load
-            )
+        # residual load and price forecast, scaled by the max demand and max bid price
+        (
+            forecast_start,
+            freq,
+            scaled_res_load,
+            scaled_price,
+        ) = self.get_scaled_forecasts(unit, market_id)
+
+        # the forecasts cover the products and the hours we look ahead
+        # positions are calculated from the timestamps in nanoseconds
+        start_ns = pd.Timestamp(start).value
+        product_len = (pd.Timestamp(end).value - start_ns) // freq
+        forecast_len = product_len + self.foresight - 1
+        offset = (start_ns - forecast_start) // freq
 
+        # checks if we are at end of simulation horizon, since we need to change the forecast then
+        # for residual load and price forecast and use the last available values
+        if offset + forecast_len > len(scaled_res_load):
+            scaled_res_load_forecast = scaled_res_load[-forecast_len:]
         else:
-            scaled_res_load_forecast = (
-                unit.forecaster[f"residual_load_{market_id}"]
-                .loc[start : end_excl + forecast_len]
-                .values
-                / scaling_factor_res_load
-            )
-
-        if end_excl + forecast_len > unit.forecaster[f"price_{market_id}"].index[-1]:
-            scaled_price_forecast = (
-                unit.forecaster[f"price_{market_id}"][
-                    -int(product_len + self.foresight - 1) :
-                ].values
-                / scaling_factor_price
-            )
+            scaled_res_load_forecast = scaled_res_load[offset : offset + forecast_len]
 
+        if offset + forecast_len > len(scaled_price):
+            scaled_price_forecast = scaled_price[-forecast_len:]
         else:
-            scaled_price_forecast = (
-                unit.forecaster[f"price_{market_id}"]
-                .loc[start : end_excl + forecast_len]
-                .values
-                / scaling_factor_price
-            )
+            scaled_price_forecast = scaled_price[offset : offset + forecast_len]
 
         # get last accepted bid volume and the current marginal costs of the unit
         current_volume = unit.get_output_before(start)
@@ -424,25 +428,50 @@ class RLAdvancedOrderStrategy(LearningStrategy):
 
         scaled_must_run_time = must_run_time / scaling_factor_must_run_time
 
-        # concat all obsverations into one array
-        observation = np.concatenate(
-            [
-                scaled_res_load_forecast,
-                scaled_price_forecast,
-                np.array(
-                    [scaled_must_run_time, scaled_max_power, scaled_marginal_cost]
-                ),
-            ]
-        )
+        # fill all obsverations into one array, which is kept for the replay buffer
+        observation = np.empty(2 * forecast_len + 3, dtype=np.float32)
+        observation[:forecast_len] = scaled_res_load_forecast
+        observation[forecast_len:-3] = scaled_price_forecast
+        observation[-3:] = scaled_must_run_time, scaled_max_power, scaled_marginal_cost
 
-        # transfer arry to GPU for NN processing
-        observation = (
-            th.tensor(observation, dtype=self.float_type)
-            .to(self.device, non_blocking=True)
-            .view(-1)
-        )
+        # the tensor shares the memory of the new array, it only needs to be copied to the GPU
+        observation = th.from_numpy(observation)
+        if self.device.type != "cpu":
+            observation = observation.to(self.device, non_blocking=True)
 
-        return observation.detach().clone()
+        return observation
+
+    def get_scaled_forecasts(
+        self, unit: SupportsMinMax, market_id: str
+    ) -> tuple[int, int, np.ndarray, np.ndarray]:
+        """
+        Gets the scaled residual load and price forecasts of a market.
+
+        The forecasts are scaled once per market and cached, so that creating an observation
+        only needs to slice the arrays instead of looking up the forecasts by time.
+
+        Args:
+            unit (SupportsMinMax): Unit to get the forecasts for
+            market_id (str): Id of the market
+
+        Returns:
+            tuple[int, int, numpy.ndarray, numpy.ndarray]: Start of the forecasts and time step of the unit in nanoseconds, scaled residual load and scaled price forecast
+        """
+        if market_id not in self._scaled_forecasts:
+            residual_load = unit.forecaster[f"residual_load_{market_id}"]
+            price = unit.forecaster[f"price_{market_id}"]
+            # the scaled forecasts are stored in the precision of the observation,
+            # so that they are copied into it without conversion
+            self._scaled_forecasts[market_id] = (
+                residual_load.index[0].value,
+                unit.index.freq.nanos,
+                (residual_load.to_numpy(dtype=float) / self.max_demand).astype(
+                    np.float32
+                ),
+                (price.to_numpy(dtype=float) / self.max_bid_price).astype(np.float32),
+            )
+
+        return self._scaled_forecasts[market_id]
 
     def calculate_reward(
         self,
@@ -478,63 +507,64 @@ class RLAdvancedOrderStrategy(LearningStrategy):
         products_index = get_products_index(orderbook)
 
         max_power = (
-            unit.forecaster.get_availability(unit.id)[products_index] * unit.max_power
+            unit.forecaster.get_availability(unit.id)[products_index].to_numpy()
+            * unit.max_power
         )
 
-        profit = pd.Series(0.0, index=products_index)
-        reward = pd.Series(0.0, index=products_index)
-        opportunity_cost = pd.Series(0.0, index=products_index)
-        costs = pd.Series(0.0, index=products_index)
+        # results are accumulated in arrays by the position of the timestep in the products
+        positions = {timestamp: i for i, timestamp in enumerate(products_index)}
+        profit = np.zeros(len(products_index))
+        opportunity_cost = np.zeros(len(products_index))
+        costs = np.zeros(len(products_index))
+
+        # the marginal costs of the dispatch are needed for the profit and the costs
+        outputs = unit.outputs[product_type].loc[products_index].to_numpy()
+        marginal_cost = np.array(
+            [
+                unit.calculate_marginal_cost(time, output)
+                for time, output in zip(products_index, outputs)
+            ]
+        )
 
         # iterate over all orders in the orderbook, to calculate order specific profit
+        # an order covers consecutive timesteps, so it is calculated on a slice of the arrays
         for order in orderbook:
             start = order["start_time"]
             end = order["end_time"]
             end_excl = end - unit.index.freq
 
-            order_times = pd.date_range(start, end_excl, freq=unit.index.freq)
-
-            # calculate profit as income - running_cost from this event
+            order_slice = slice(positions[start], positions[end_excl] + 1)
+            order_times = products_index[order_slice]
 
-            for start in order_times:
-                marginal_cost = unit.calculate_marginal_cost(
-                    start, unit.outputs[product_type].loc[start]
-                )
-                if isinstance(order["accepted_volume"], dict):
-                    accepted_volume = order["accepted_volume"][start]
-                else:
-                    accepted_volume = order["accepted_volume"]
+            accepted_volume = order["accepted_volume"]
+            if isinstance(accepted_volume, dict):
+                accepted_volume = np.array([accepted_volume[t] for t in order_times])
 
-                if isinstance(order["accepted_price"], dict):
-                    accepted_price = order["accepted_price"][start]
-                else:
-                    accepted_price = order["accepted_price"]
+            accepted_price = order["accepted_price"]
+            if isinstance(accepted_price, dict):
+                accepted_price = np.array([accepted_price[t] for t in order_times])
 
-                price_difference = accepted_price - marginal_cost
+            price_difference = accepted_price - marginal_cost[order_slice]
 
-                # calculate opportunity cost
-                # as the loss of income we have because we are not running at full power
-                order_opportunity_cost = price_difference * (
-                    max_power[start] - unit.outputs[product_type].loc[start]
-                )
-                # if our opportunity costs are negative, we did not miss an opportunity to earn money and we set them to 0
-                # don't consider opportunity_cost more than once! Always the same for one timestep and one market
-                opportunity_cost[start] = max(order_opportunity_cost, 0)
-                profit[start] += accepted_price * accepted_volume
-
-        # consideration of start-up costs, which are evenly divided between the
-        # upward and downward regulation events
-        for start in products_index:
-            op_time = unit.get_operation_time(start)
-
-            marginal_cost = unit.calculate_marginal_cost(
-                start, unit.outputs[product_type].loc[start]
+            # calculate opportunity cost
+            # as the loss of income we have because we are not running at full power
+            order_opportunity_cost = price_difference * (
+                max_power[order_slice] - outputs[order_slice]
             )
-            costs[start] += marginal_cost * unit.outputs[product_type].loc[start]
+            # if our opportunity costs are negative, we did not miss an opportunity to earn money and we set them to 0
+            # don't consider opportunity_cost more than once! Always the same for one timestep and one market
+            opportunity_cost[order_slice] = np.maximum(order_opportunity_cost, 0)
+            # calculate profit as income - running_cost from this event
+            profit[order_slice] += accepted_price * accepted_volume
 
-            if unit.outputs[product_type].loc[start] != 0 and op_time < 0:
-                start_up_cost = unit.get_starting_costs(op_time)
-                costs[start] += start_up_cost
+        # running costs of the dispatch
+        costs += marginal_cost * outputs
+
+        # consideration of start-up costs, which only occur if the unit is running
+        for i in np.flatnonzero(outputs != 0):
+            op_time = unit.get_operation_time(products_index[i])
+            if op_time < 0:
+                costs[i] += unit.get_starting_costs(op_time)
 
         # ---------------------------
         # 4.1 Calculate Reward
@@ -542,7 +572,7 @@ class RLAdvancedOrderStrategy(LearningStrategy):
         # in the learning process, so we add a regret term to the reward, which is the opportunity cost
         # define the reward and scale it
 
-        profit += -costs
+        profit -= costs
         scaling = 1 / (unit.max_power * self.max_bid_price)
         regret_scale = 0.0
         reward = (profit - regret_scale * opportunity_cost) * scaling
@@ -562,11 +592,16 @@ class RLAdvancedOrderStrategy(LearningStrategy):
         """
         directory = f"{load_path}/actors/actor_{self.unit_id}.pt"
 
-        params = th.load(directory, map_location=self.device)
+        params = th.load(directory, map_location=self.device, weights_only=True)
 
         self.actor = Actor(self.obs_dim, self.act_dim, self.float_type)
         self.actor.load_state_dict(params["actor"])
 
+        if not self.learning_mode:
+            # the loaded actor is only used for inference
+            self.actor.eval()
+            self.actor.requires_grad_(False)
+
         if self.learning_mode:
             self.actor_target = Actor(self.obs_dim, self.act_dim, self.float_type)
             self.actor_target.load_state_dict(params["actor_target"])
@@ -202,12 +202,13 @@ class RLStrategy(LearningStrategy):
             # to get a good initial experience, in the area around the costs of the agent
             if self.collect_initial_experience_mode:
                 # define current action as soley noise
-                noise = (
-                    th.normal(
-                        mean=0.0, std=0.2, size=(1, self.act_dim), dtype=self.float_type
-                    )
-                    .to(self.device)
-                    .squeeze()
+                # the noise is drawn on the device, it is not reused as it is stored in the outputs
+                noise = th.normal(
+                    mean=0.0,
+                    std=0.2,
+                    size=(self.act_dim,),
+                    dtype=self.float_type,
+                    device=self.device,
                 )
 
                 # =============================================================================
@@ -218,20 +219,21 @@ class RLStrategy(LearningStrategy):
                 # add noise to the last dimension of the observation
                 # needs to be adjusted if observation space is changed, because only makes sense
                 # if the last dimension of the observation space are the marginal cost
-                curr_action = noise + base_bid.clone().detach()
+                curr_action = noise + base_bid
 
             else:
                 # if we are not in the initial exploration phase we chose the action with the actor neural net
                 # and add noise to the action
-                curr_action = self.actor(next_observation).detach()
-                noise = th.tensor(
-                    self.action_noise.noise(), device=self.device, dtype=self.float_type
-                )
+                # no graph is needed, as the actor is trained on the buffered observations
+                with th.no_grad():
+                    curr_action = self.actor(next_observation)
+                noise = self.get_action_noise()
                 curr_action += noise
         else:
             # if we are not in learning mode we just use the actor neural net to get the action without adding noise
 
-            curr_action = self.actor(next_observation).detach()
+            with th.no_grad():
+                curr_action = self.actor(next_observation)
             noise = tuple(0 for _ in range(self.act_dim))
 
         curr_action = curr_action.clamp(-1, 1)
@@ -342,14 +344,12 @@ class RLStrategy(LearningStrategy):
             ]
         )
 
-        # transfer arry to GPU for NN processing
-        observation = (
-            th.tensor(observation, dtype=self.float_type)
-            .to(self.device, non_blocking=True)
-            .view(-1)
-        )
+        # the tensor is created from the new array, it only needs to be copied to the GPU
+        observation = th.from_numpy(observation).to(self.float_type)
+        if self.device.type != "cpu":
+            observation = observation.to(self.device, non_blocking=True)
 
-        return observation.detach().clone()
+        return observation
 
     def calculate_reward(
         self,
@@ -453,11 +453,16 @@ class RLStrategy(LearningStrategy):
         """
         directory = f"{load_path}/actors/actor_{self.unit_id}.pt"
 
-        params = th.load(directory, map_location=self.device)
+        params = th.load(directory, map_location=self.device, weights_only=True)
 
         self.actor = Actor(self.obs_dim, self.act_dim, self.float_type)
         self.actor.load_state_dict(params["actor"])
 
+        if not self.learning_mode:
+            # the loaded actor is only used for inference
+            self.actor.eval()
+            self.actor.requires_grad_(False)
+
         if self.learning_mode:
             self.actor_target = Actor(self.obs_dim, self.act_dim, self.float_type)
             self.actor_target.load_state_dict(params["actor_target"])
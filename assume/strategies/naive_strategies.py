@@ -43,38 +43,44 @@ class NaiveSingleBidStrategy(BaseStrategy):
             start, end_all
         )  # minimum and maximum power output of the unit between the start time of the first product and the end time of the last product
 
-        if "node" in market_config.additional_fields:
+        # read the power outputs and bounds of all products in one go
+        # instead of indexing the pandas series for every product.
+        # plain floats keep the sequential ramping loop below cheap
+        product_starts = [product[0] for product in product_tuples]
+        current_powers = unit.outputs["energy"].loc[product_starts].tolist()
+        max_powers = max_power.loc[product_starts].tolist()
+
+        with_node = "node" in market_config.additional_fields
+        if with_node:
             node = unit.node
+            min_powers = min_power.loc[product_starts].tolist()
 
         bids = []
-        for product in product_tuples:
+        for i, (start, end, only_hours) in enumerate(product_tuples):
             # for each product, calculate the marginal cost of the unit at the start time of the product
             # and the volume of the product. Dispatch the order to the market.
-            start = product[0]
-            current_power = unit.outputs["energy"].at[
-                start
+            current_power = current_powers[
+                i
             ]  # power output of the unit at the start time of the current product
             marginal_cost = unit.calculate_marginal_cost(
                 start, previous_power
             )  # calculation of the marginal costs
             volume = unit.calculate_ramp(
-                op_time, previous_power, max_power[start], current_power
+                op_time, previous_power, max_powers[i], current_power
             )
             bids.append(
                 {
-                    "start_time": product[0],
-                    "end_time": product[1],
-                    "only_hours": product[2],
+                    "start_time": start,
+                    "end_time": end,
+                    "only_hours": only_hours,
                     "price": marginal_cost,
                     "volume": volume,
                 }
             )
 
-            if "node" in market_config.additional_fields:
+            if with_node:
                 bids[-1]["max_power"] = unit.max_power if volume > 0 else unit.min_power
-                bids[-1]["min_power"] = (
-                    min_power[start] if volume > 0 else unit.max_power
-                )
+                bids[-1]["min_power"] = min_powers[i] if volume > 0 else unit.max_power
                 bids[-1]["node"] = node
 
             previous_power = volume + current_power
@@ -83,7 +89,7 @@ class NaiveSingleBidStrategy(BaseStrategy):
             else:
                 op_time = min(op_time, 0) - 1
 
-        if "node" in market_config.additional_fields:
+        if with_node:
             return bids
         else:
             return self.remove_empty_bids(bids)
@@ -144,15 +150,24 @@ class NaiveProfileStrategy(BaseStrategy):
         return bids
 
 
-class NaivePosReserveStrategy(BaseStrategy):
+class NaiveReserveStrategy(BaseStrategy):
     """
-    A naive strategy that bids the ramp up volume on the positive reserve market (price = 0).
+    Base class of the naive reserve strategies, which bid the possible ramping volume
+    of the unit on a reserve market (price = 0).
+
+    Attributes:
+        power_bound (str): "max" to ramp up to the maximum power, "min" to ramp down to the minimum power.
+        ramp_from_output (bool): Whether the ramp of each product starts from the actual output before it
+            instead of the power after the reserve of the previous product.
 
     Args:
         *args: Variable length argument list.
         **kwargs: Arbitrary keyword arguments.
     """
 
+    power_bound = "max"
+    ramp_from_output = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -181,22 +196,27 @@ class NaivePosReserveStrategy(BaseStrategy):
         min_power, max_power = unit.calculate_min_max_power(
             start, end_all, market_config.product_type
         )
+        bound = max_power if self.power_bound == "max" else min_power
+
+        product_starts = [product[0] for product in product_tuples]
+        current_powers = unit.outputs["energy"].loc[product_starts].tolist()
+        bounds = bound.loc[product_starts].tolist()
 
         bids = []
-        for product in product_tuples:
-            start = product[0]
+        for i, (start, end, only_hours) in enumerate(product_tuples):
             op_time = unit.get_operation_time(start)
-            current_power = unit.outputs["energy"].at[start]
+            if self.ramp_from_output:
+                previous_power = unit.get_output_before(start)
+            current_power = current_powers[i]
             volume = unit.calculate_ramp(
-                op_time, previous_power, max_power[start], current_power
+                op_time, previous_power, bounds[i], current_power
             )
-            price = 0
             bids.append(
                 {
-                    "start_time": product[0],
-                    "end_time": product[1],
-                    "only_hours": product[2],
-                    "price": price,
+                    "start_time": start,
+                    "end_time": end,
+                    "only_hours": only_hours,
+                    "price": 0,
                     "volume": volume,
                 }
             )
@@ -207,68 +227,28 @@ class NaivePosReserveStrategy(BaseStrategy):
         return bids
 
 
-class NaiveNegReserveStrategy(BaseStrategy):
+class NaivePosReserveStrategy(NaiveReserveStrategy):
     """
-    A naive strategy that bids the ramp down volume on the negative reserve market (price = 0).
+    A naive strategy that bids the ramp up volume on the positive reserve market (price = 0).
 
     Args:
         *args: Variable length argument list.
         **kwargs: Arbitrary keyword arguments.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
 
-    def calculate_bids(
-        self,
-        unit: SupportsMinMax,
-        market_config: MarketConfig,
-        product_tuples: list[Product],
-        **kwargs,
-    ) -> Orderbook:
-        """
-        Takes information from a unit that the unit operator manages and
-        defines how it is dispatched to the market.
-
-        Args:
-            unit (SupportsMinMax): The unit to be dispatched.
-            market_config (MarketConfig): The market configuration.
-            product_tuples (list[Product]): The list of all products the unit can offer.
-
-        Returns:
-            Orderbook: The bids consisting of the start time, end time, only hours, price and volume.
-        """
-        start = product_tuples[0][0]
-        end_all = product_tuples[-1][1]
-        previous_power = unit.get_output_before(start)
-        min_power, max_power = unit.calculate_min_max_power(
-            start, end_all, market_config.product_type
-        )
-
-        bids = []
-        for product in product_tuples:
-            start = product[0]
-            op_time = unit.get_operation_time(start)
-            previous_power = unit.get_output_before(start)
-            current_power = unit.outputs["energy"].at[start]
-            volume = unit.calculate_ramp(
-                op_time, previous_power, min_power[start], current_power
-            )
-            price = 0
-            bids.append(
-                {
-                    "start_time": product[0],
-                    "end_time": product[1],
-                    "only_hours": product[2],
-                    "price": price,
-                    "volume": volume,
-                }
-            )
-            previous_power = volume + current_power
+class NaiveNegReserveStrategy(NaiveReserveStrategy):
+    """
+    A naive strategy that bids the ramp down volume on the negative reserve market (price = 0).
 
-        bids = self.remove_empty_bids(bids)
+    Args:
+        *args: Variable length argument list.
+        **kwargs: Arbitrary keyword arguments.
+    """
 
-        return bids
+    power_bound = "min"
+    # the ramp down volume is based on the actual output before each product
+    ramp_from_output = True
 
 
 class NaiveRedispatchStrategy(BaseStrategy):
@@ -308,25 +288,28 @@ class NaiveRedispatchStrategy(BaseStrategy):
         min_power, max_power = unit.min_power, unit.max_power
         node = unit.node
 
-        bids = []
-        for product in product_tuples:
-            start = product[0]
-            current_power = unit.outputs["energy"].at[start]
-            marginal_cost = unit.calculate_marginal_cost(
-                start, previous_power
-            )  # calculation of the marginal costs
+        product_starts = [product[0] for product in product_tuples]
+        current_powers = unit.outputs["energy"].loc[product_starts].tolist()
+        # the marginal costs are based on the power before the first product
+        # so they can be calculated for all products at once
+        marginal_costs = unit.calculate_marginal_cost_vector(
+            product_starts, [previous_power] * len(product_starts)
+        )
 
-            bids.append(
-                {
-                    "start_time": product[0],
-                    "end_time": product[1],
-                    "only_hours": product[2],
-                    "price": marginal_cost,
-                    "volume": current_power,
-                    "max_power": max_power,
-                    "min_power": min_power,
-                    "node": node,
-                }
+        bids = [
+            {
+                "start_time": start,
+                "end_time": end,
+                "only_hours": only_hours,
+                "price": marginal_cost,
+                "volume": current_power,
+                "max_power": max_power,
+                "min_power": min_power,
+                "node": node,
+            }
+            for (start, end, only_hours), current_power, marginal_cost in zip(
+                product_tuples, current_powers, marginal_costs
             )
+        ]
 
         return bids
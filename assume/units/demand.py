@@ -116,6 +116,21 @@ class Demand(SupportsMinMax):
         """
         return self.price.at[start]
 
+    def calculate_marginal_cost_vector(
+        self, starts: list[pd.Timestamp], powers: list[float]
+    ) -> list[float]:
+        """
+        Returns the bid prices of the demand for multiple start times at once.
+
+        Args:
+            starts (list[pandas.Timestamp]): The start times of the dispatch.
+            powers (list[float]): The power output of the unit at each start time.
+
+        Returns:
+            list[float]: The marginal costs of the unit for the given start times.
+        """
+        return self.price.loc[starts].tolist()
+
     def as_dict(self) -> dict:
         """
         Returns the unit as a dictionary.
@@ -373,6 +373,24 @@ class PowerPlant(SupportsMinMax):
                 timestep=start,
             )
 
+    def calculate_marginal_cost_vector(
+        self, starts: list[pd.Timestamp], powers: list[float]
+    ) -> list[float]:
+        """
+        Calculates the marginal costs of the unit for multiple start times at once.
+        If the marginal costs are precomputed, they are looked up for all start times in one go.
+
+        Args:
+            starts (list[pandas.Timestamp]): The start times of the dispatch.
+            powers (list[float]): The power output of the unit at each start time.
+
+        Returns:
+            list[float]: The marginal costs of the unit.
+        """
+        if self.marginal_cost is not None and len(self.marginal_cost) > 1:
+            return self.marginal_cost.loc[starts].tolist()
+        return super().calculate_marginal_cost_vector(starts, powers)
+
     def as_dict(self) -> dict:
         """
         Returns the attributes of the unit as a dictionary, including specific attributes.
@@ -531,6 +531,11 @@ class World:
             else:
                 self.clock.set_time(end_ts)
         pbar.close()
+        # stop the market operators first, so that the output agent still receives their buffered results
+        await asyncio.gather(
+            *(agent.shutdown() for agent in self.market_operators.values())
+        )
+        await tasks_complete_or_sleeping(self.container)
         await self.container.shutdown()
 
     def run(self):
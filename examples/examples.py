@@ -62,15 +62,16 @@ availabe_examples = {
 }
 
 # %%
-if __name__ == "__main__":
-    """
-    Available examples:
-    - local_db: without database and grafana
-    - timescale: with database and grafana (note: you need docker installed)
+
+
+def run_example(example: str, data_format: str = "local_db"):
     """
-    data_format = "local_db"  # "local_db" or "timescale"
-    example = "small"
+    Loads and runs one of the available examples.
 
+    Args:
+        example (str): The name of the example in availabe_examples.
+        data_format (str): "local_db" to write into a sqlite file per example or "timescale".
+    """
     if data_format == "local_db":
         db_uri = f"sqlite:///./examples/local_db/assume_db_{example}.db"
     elif data_format == "timescale":
@@ -117,3 +118,16 @@ if __name__ == "__main__":
         )
 
     world.run()
+
+
+if __name__ == "__main__":
+    """
+    Available examples:
+    - local_db: without database and grafana
+    - timescale: with database and grafana (note: you need docker installed)
+    """
+    data_format = "local_db"  # "local_db" or "timescale"
+    examples = ["small"]
+
+    for example in examples:
+        run_example(example, data_format)
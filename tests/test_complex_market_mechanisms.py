@@ -5,6 +5,7 @@
 import math
 from datetime import datetime, timedelta
 
+import pytest
 from dateutil import rrule as rr
 from dateutil.relativedelta import relativedelta as rd
 
@@ -317,6 +318,24 @@ def test_complex_clearing_LB():
     assert rejected_orders == []
 
 
+def test_complex_clearing_invalid_orderbook():
+    import copy
+
+    market_config = copy.copy(simple_dayahead_auction_config)
+    market_config.volume_tick = None
+    market_config.maximum_bid_volume = 1000
+    market_config.additional_fields = ["bid_type"]
+    next_opening = market_config.opening_hours.after(datetime.now())
+    products = get_available_products(market_config.market_products, next_opening)
+
+    mr = ComplexClearingRole(market_config)
+    mr.open_auctions |= {(p[0], p[1], None) for p in products}
+
+    orderbook = extend_orderbook(products, 500, 50, bid_type="XB")
+    with pytest.raises(ValueError, match="bid_type XB"):
+        mr.validate_orderbook(orderbook, ("agent_addr", "agent_id"))
+
+
 if __name__ == "__main__":
     pass
     # from assume.common.utils import plot_orderbook
@@ -4,14 +4,16 @@
 
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import pytest
 from dateutil import rrule as rr
+from pyomo.environ import ConcreteModel, Var
 
 from assume.common.forecasts import NaiveForecast
 from assume.common.market_objects import MarketConfig, MarketProduct
 from assume.common.utils import get_available_products
-from assume.strategies.dmas_powerplant import DmasPowerplantStrategy
+from assume.strategies.dmas_powerplant import DmasPowerplantStrategy, get_values
 from assume.units import PowerPlant
 
 from .utils import get_test_prices
@@ -214,5 +216,14 @@ def test_dmas_prevent_start_end(power_plant_day):
     assert unknown == [], "found unknown link orders"
 
 
+def test_get_values():
+    model = ConcreteModel()
+    model.x = Var(range(3), initialize={0: 1.5, 1: 0, 2: -2})
+
+    values = get_values(model.x)
+    assert isinstance(values, np.ndarray)
+    assert values.tolist() == [1.5, 0, -2]
+
+
 if __name__ == "__main__":
     pytest.main(["-s", __file__])
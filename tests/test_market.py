@@ -21,14 +21,17 @@ end = datetime(2020, 12, 2)
 
 
 @pytest.fixture
-async def market_role() -> MarketRole:
+async def market_role(request) -> MarketRole:
     market_id = "Test"
+    # additional config values can be passed through indirect parametrization
+    config_params = getattr(request, "param", {})
     marketconfig = MarketConfig(
         market_id=market_id,
         opening_hours=rr.rrule(rr.HOURLY, dtstart=start, until=end),
         opening_duration=rd(hours=1),
         market_mechanism="pay_as_clear",
         market_products=[MarketProduct(rd(hours=1), 1, rd(hours=1))],
+        **config_params,
     )
     clock = ExternalClock(0)
     container = await create_container(addr=("0.0.0.0", 9098), clock=clock)
@@ -102,6 +105,11 @@ async def test_market_tick(market_role: MarketRole):
     # this does not work
     assert len(market_role.all_orders) == 1
 
+    # only the first order which is not in ticks is reported
+    orderbook[0]["bid_id"] = "gen1_1"
+    with pytest.raises(ValueError, match=r"^order gen1_1 at .* - price 120.123 not"):
+        market_role.validate_orderbook(orderbook, ("addr", "gen1"))
+
 
 async def test_market_max(market_role: MarketRole):
     meta = {
@@ -170,6 +178,16 @@ async def test_market_max(market_role: MarketRole):
     assert market_role.all_orders[0]["price"] == 1000
     assert market_role.all_orders[0]["volume"] == 9090
 
+    # invalid orders raise independent of assertions being enabled
+    orderbook[0]["price"] = 1001
+    orderbook[0]["bid_id"] = "gen1_1"
+    with pytest.raises(ValueError, match=f"order gen1_1 at {start} exceeds"):
+        market_role.validate_orderbook(orderbook, ("addr", "gen1"))
+
+    # changes of the market config apply to the next validation
+    market_role.marketconfig.maximum_bid_price = 1100
+    market_role.validate_orderbook(orderbook, ("addr", "gen1"))
+
 
 async def test_market_for_BB(market_role: MarketRole):
     meta = {
@@ -201,6 +219,28 @@ async def test_market_for_BB(market_role: MarketRole):
     assert len(market_role.all_orders) == 1
 
 
+@pytest.mark.parametrize(
+    "market_role", [{"volume_tick": 0.1, "maximum_bid_volume": None}], indirect=True
+)
+async def test_market_volume_tick_without_max_volume(market_role: MarketRole):
+    # the market can be created, the missing limit is only reported on validation
+    assert market_role.get_bid_limits()[2] is None
+    market_role.open_auctions |= {(start, end, None)}
+
+    orderbook = [
+        {
+            "start_time": start,
+            "end_time": end,
+            "volume": 10,
+            "price": 20,
+            "agent_id": "gen1",
+            "only_hours": None,
+        }
+    ]
+    with pytest.raises(ValueError, match="max_volume unset"):
+        market_role.validate_orderbook(orderbook, ("addr", "gen1"))
+
+
 async def test_market_registration(market_role: MarketRole):
     meta = {
         "sender_addr": "test_address",
@@ -245,3 +285,61 @@ async def test_market_unmatched(market_role: MarketRole):
     }
 
     market_role.handle_get_unmatched(content, meta)
+
+    # the submitted order is found by its product
+    product = (start, end, None)
+    assert market_role.orders_by_product[product] == orderbook
+
+
+@pytest.mark.parametrize(
+    "market_role", [{"param_dict": {"write_batch_size": 2}}], indirect=True
+)
+async def test_market_write_batch(market_role: MarketRole):
+    written_results = []
+
+    async def store_market_results(market_meta):
+        written_results.append(market_meta)
+
+    market_role.store_market_results = store_market_results
+    products = [(start, start + rd(hours=1), None)]
+
+    await market_role.clear_market(products)
+    # results are buffered until the batch is full
+    assert written_results == []
+
+    await market_role.clear_market(products)
+    assert len(written_results) == 1
+
+
+@pytest.mark.parametrize(
+    "market_role", [{"param_dict": {"write_batch_size": 3}}], indirect=True
+)
+async def test_market_write_batch_on_stop(market_role: MarketRole):
+    written_results = []
+
+    async def store_market_results(market_meta):
+        written_results.append(market_meta)
+
+    market_role.store_market_results = store_market_results
+    products = [(start, start + rd(hours=1), None)]
+
+    await market_role.clear_market(products)
+    await market_role.clear_market(products)
+    assert written_results == []
+
+    # the simulation ends before the batch is full
+    await market_role.on_stop()
+    assert len(written_results) == 1
+
+    # nothing is left to be written
+    await market_role.on_stop()
+    assert len(written_results) == 1
+
+
+async def test_market_clearing_closes_auctions(market_role: MarketRole):
+    products = [(start, start + rd(hours=1), None)]
+    market_role.open_auctions |= set(products)
+
+    await market_role.clear_market(products)
+    assert market_role.open_auctions == set()
+    assert market_role.all_orders == []
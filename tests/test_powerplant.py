@@ -103,6 +103,18 @@ def test_init_function(power_plant_1, power_plant_2, power_plant_3):
     assert power_plant_3.marginal_cost.to_dict() == pd.Series(40, index).to_dict()
 
 
+def test_calculate_marginal_cost_vector(power_plant_1):
+    starts = list(power_plant_1.index)
+    powers = [0, 200, 500, 1000]
+    marginal_costs = power_plant_1.calculate_marginal_cost_vector(starts, powers)
+
+    assert marginal_costs == [40.0, 52.0, 64.0, 66.0]
+    assert marginal_costs == [
+        power_plant_1.calculate_marginal_cost(start, power)
+        for start, power in zip(starts, powers)
+    ]
+
+
 def test_reset_function(power_plant_1):
     # check if total_power_output is reset
     assert power_plant_1.outputs["energy"].equals(
@@ -113,3 +113,43 @@ def test_learning_advanced_orders(mock_market_config, power_plant):
 
     assert bids[0]["bid_id"] == "test_pp_LB_1"
     assert bids[-1]["bid_id"] == "test_pp_block"
+
+
+@pytest.mark.require_learning
+def test_learning_advanced_orders_reward(mock_market_config, power_plant):
+    learning_config: LearningConfig = {
+        "observation_dimension": 97,
+        "action_dimension": 2,
+        "algorithm": "matd3",
+        "learning_mode": True,
+        "training_episodes": 3,
+        "order_types": ["SB"],
+        "unit_id": "test_pp",
+    }
+
+    product_index = pd.date_range("2023-07-01", periods=24, freq="h")
+    mc = mock_market_config
+    product_tuples = [
+        (start, start + pd.Timedelta(hours=1), None) for start in product_index
+    ]
+
+    strategy = RLAdvancedOrderStrategy(**learning_config)
+    bids = strategy.calculate_bids(power_plant, mc, product_tuples=product_tuples)
+
+    # only the inflexible bids are accepted
+    for order in bids:
+        order["accepted_price"] = 50
+        order["accepted_volume"] = order["volume"] if order["volume"] == 200 else 0
+    power_plant.outputs["energy"].loc[product_index] = 200
+
+    strategy.calculate_reward(power_plant, mc, orderbook=bids)
+    reward = power_plant.outputs["reward"].loc[product_index]
+    profit = power_plant.outputs["profit"].loc[product_index]
+    regret = power_plant.outputs["regret"].loc[product_index]
+    costs = power_plant.outputs["total_costs"].loc[product_index]
+
+    # marginal costs are 40 €/MWh at 200 MW
+    assert (profit == 2000.0).all()
+    assert (reward == 0.02).all()
+    assert (regret == 8000.0).all()
+    assert (costs == 8000.0).all()
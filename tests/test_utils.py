@@ -3,9 +3,12 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 import calendar
+import math
 from datetime import datetime, timedelta, timezone
+from fractions import Fraction
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from dateutil import rrule as rr
@@ -16,11 +19,13 @@ from assume.common.utils import (
     aggregate_step_amount,
     datetime2timestamp,
     get_available_products,
+    get_first_invalid_order,
     get_products_index,
     initializer,
     plot_orderbook,
     separate_orders,
     timestamp2datetime,
+    to_fraction,
     visualize_orderbook,
 )
 from assume.scenario.loader_csv import convert_to_rrule_freq, make_market_config
@@ -100,6 +105,16 @@ def test_available_products():
         assert prod[2] is None, "only_hour {i}"
         i += 1
 
+    market_products = [
+        MarketProduct(rr.rrule(rr.DAILY, dtstart=start), 2),
+    ]
+
+    products = get_available_products(market_products, start)
+    assert products == [
+        (start, start + timedelta(days=1), None),
+        (start + timedelta(days=1), start + timedelta(days=2), None),
+    ]
+
 
 def test_aggregate_step_amount():
     start = datetime(2020, 1, 1)
@@ -344,6 +359,24 @@ def test_sep_block_orders():
         assert True not in [isinstance(order[key], dict) for key in order.keys()]
 
 
+def test_get_first_invalid_order():
+    prices = np.array([10, 3000, -600, 20])
+    volumes = np.array([100, 100, -100, -2500])
+
+    assert get_first_invalid_order(prices, volumes, 3000, -500) == 2
+    assert get_first_invalid_order(prices, volumes, 3000, -1000) == -1
+    assert get_first_invalid_order(prices, volumes, 3000, -1000, 2000) == 3
+    assert get_first_invalid_order(prices, volumes, 2000, -1000, 2000) == 1
+
+    # NaN is outside of every limit
+    nan_prices = np.array([10, np.nan])
+    nan_volumes = np.array([100, np.nan])
+    valid = np.array([10, 100])
+    assert get_first_invalid_order(nan_prices, valid, 3000, -500) == 1
+    assert get_first_invalid_order(valid, nan_volumes, 3000, -500) == -1
+    assert get_first_invalid_order(valid, nan_volumes, 3000, -500, 2000) == 1
+
+
 def test_get_products_index():
     index_1 = pd.date_range(
         start=datetime(2020, 1, 1, 0), end=datetime(2020, 1, 1, 5), freq="1h"
@@ -446,6 +479,16 @@ def test_datetime2timestamp():
     assert 0 == datetime2timestamp(unix_start)
 
 
+def test_to_fraction():
+    assert to_fraction(0.1) == Fraction(1, 10)
+    assert to_fraction(3000) == 3000
+    assert to_fraction(1e-05) == Fraction(1, 100000)
+    # float division gives 0.3 / 0.1 = 2.9999999999999996, which is floored to 2
+    assert math.floor(0.3 / 0.1) == 2
+    assert to_fraction(0.3) // to_fraction(0.1) == 3
+    assert to_fraction(3000) // to_fraction(0.1) == 30000
+
+
 if __name__ == "__main__":
     test_convert_rrule()
     test_available_products()